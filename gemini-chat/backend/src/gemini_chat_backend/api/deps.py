@@ -1,11 +1,12 @@
 """FastAPI dependencies."""
 
-from typing import AsyncGenerator
+import uuid
 
 from fastapi import Request
 
 from gemini_chat_backend.config import Settings, settings
-from gemini_chat_backend.utils.logging import get_logger, get_request_logger
+from gemini_chat_backend.core.deepseek import DeepSeekClient
+from gemini_chat_backend.utils.logging import get_request_logger
 
 
 async def get_settings() -> Settings:
@@ -30,6 +31,19 @@ async def get_logger_dep(request: Request):
     return get_request_logger(request_id=request_id)
 
 
+def get_client(request: Request) -> DeepSeekClient:
+    """Get the application-wide DeepSeek client.
+
+    Args:
+        request: FastAPI request object
+
+    Returns:
+        DeepSeek client created at startup
+    """
+    client: DeepSeekClient = request.app.state.deepseek
+    return client
+
+
 def get_request_id(request: Request) -> str:
     """Get or generate request ID.
 
@@ -41,8 +55,6 @@ def get_request_id(request: Request) -> str:
     """
     request_id = getattr(request.state, "request_id", None)
     if not request_id:
-        import uuid
-
-        request_id = str(uuid.uuid4())
+        request_id = uuid.uuid4().hex
         request.state.request_id = request_id
     return request_id
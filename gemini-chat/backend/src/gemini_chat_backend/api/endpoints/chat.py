@@ -1,28 +1,51 @@
 """Chat endpoint with streaming support and ReAct pattern."""
 
-import json
+import asyncio
+import itertools
+import os
 import time
 import uuid
-from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple, Type, get_args
 
-from fastapi import APIRouter
-from fastapi.responses import StreamingResponse
+import orjson
+import structlog
+from fastapi import APIRouter, Depends, Request
+from fastapi.exceptions import RequestValidationError
+from pydantic import BaseModel, TypeAdapter, ValidationError
 
-from gemini_chat_backend.config import settings
+from gemini_chat_backend.api.deps import get_client
+from gemini_chat_backend.api.responses import SSEResponse
 from gemini_chat_backend.core.deepseek import DeepSeekClient, DeepSeekError
 from gemini_chat_backend.core.reasoning_parser import extract_thought_title
-from gemini_chat_backend.models.react import (
-    ReActAction,
-    ReActObservation,
-    ReActStep,
-    ReActThought,
-)
-from gemini_chat_backend.models.chat import ChatRequest, StreamEvent
-from gemini_chat_backend.tools.registry import get_tool_registry
-from gemini_chat_backend.utils.logging import get_request_logger
+from gemini_chat_backend.models.chat import ChatRequest, Message, StreamEvent
+from gemini_chat_backend.tools.base import BaseTool, ToolResult
+from gemini_chat_backend.tools.registry import ToolRegistry, get_tool_registry
+from gemini_chat_backend.utils.logging import get_logger
+
+logger = get_logger(__name__)
 
 router = APIRouter()
 
+# SSE framing, pre-encoded so each event is a single bytes concatenation
+_SSE_PREFIX = b"data: "
+_SSE_SUFFIX = b"\n\n"
+
+# Per-type frame heads, so sse() only has to encode the event data
+_SSE_EVENT_PREFIXES: Dict[str, bytes] = {
+    event_type: _SSE_PREFIX + b'{"type":"' + event_type.encode() + b'","data":'
+    for event_type in get_args(StreamEvent.model_fields["type"].annotation)
+}
+_SSE_EVENT_SUFFIX = b"}" + _SSE_SUFFIX
+
+# Constant terminal frames
+_DONE_FRAME = _SSE_EVENT_PREFIXES["done"] + b"null" + _SSE_EVENT_SUFFIX
+_ERROR_FRAME_PREFIX = _SSE_EVENT_PREFIXES["error"] + b'{"message":'
+_ERROR_FRAME_SUFFIX = b"}" + _SSE_EVENT_SUFFIX
+_INTERNAL_ERROR_FRAME = (
+    _ERROR_FRAME_PREFIX + orjson.dumps("Internal server error") + _ERROR_FRAME_SUFFIX
+)
+
 # System prompt for ReAct pattern
 REACT_SYSTEM_PROMPT = """You are an AI assistant that follows the ReAct (Reasoning + Acting) pattern.
 
@@ -101,54 +124,433 @@ User: "What's the weather in Beijing today?"
 Thought: "Need to query real-time weather information, should call the weather tool" ← CORRECT"""
 
 
-def format_sse(event: StreamEvent) -> str:
-    """Format a stream event as SSE.
+def sse(event_type: str, data: Any) -> bytes:
+    """Format an event as an SSE frame without building a StreamEvent model.
 
     Args:
-        event: Stream event
+        event_type: One of the StreamEvent types
+        data: JSON-serializable event data
 
     Returns:
-        SSE formatted string
+        SSE formatted bytes
     """
-    return f"data: {json.dumps(event.model_dump())}\n\n"
+    return (
+        _SSE_EVENT_PREFIXES[event_type] + orjson.dumps(data, default=str) + _SSE_EVENT_SUFFIX
+    )
 
 
-def _ensure_thought_exists(
-    last_step: Optional[ReActStep],
-    tool_name: str,
-) -> Tuple[Optional[ReActStep], Optional[ReActThought]]:
-    """Ensure a thought step exists before creating an action.
+# Thought titles are re-extracted after this many new reasoning characters,
+# or earlier when a delta closes a sentence or line
+_TITLE_RECHECK_CHARS = 64
+_TITLE_BOUNDARIES = (".", "?", "!", "\n")
+
+# Titles are extracted from this much leading reasoning. Titles only come
+# from the first line or sentence and are under 80 characters, so text past
+# this point cannot change them.
+_TITLE_WINDOW_CHARS = 512
+
+# Streamed text deltas are merged into one frame until this many characters
+# are buffered or the oldest buffered delta has waited this many seconds
+_DELTA_FLUSH_LIMITS: Dict[str, Tuple[int, float]] = {
+    "content": (64, 0.010),
+    "reasoning_content": (256, 0.050),
+}
+# Each flush triggered by size doubles that field's character window, up to
+# this cap: the first frames stay small, and fast streams get larger frames
+_DELTA_FLUSH_MAX_CHARS = 2048
+
+# Tool definitions sent to DeepSeek, cached per registry instance and version
+_tools_cache: Tuple[Optional[ToolRegistry], int, Optional[List[Dict[str, Any]]]] = (None, -1, None)
+
+
+def _get_tool_definitions(tool_registry: ToolRegistry) -> Optional[List[Dict[str, Any]]]:
+    """Get tool definitions for DeepSeek, rebuilding only when the registry changes.
+
+    Definitions are put in a canonical form (sorted by tool name, keys sorted)
+    and the same list object is kept across requests, so the request prefix
+    stays byte-identical regardless of registration order, which lets DeepSeek
+    reuse its prompt cache.
+
+    Args:
+        tool_registry: Tool registry to read definitions from
+
+    Returns:
+        List of tool definitions, or None if no tools are registered
+    """
+    global _tools_cache
+    registry, version, tools = _tools_cache
+    if registry is not tool_registry or version != tool_registry.version:
+        tools = tool_registry.get_definitions() or None
+        if tools:
+            # Sorted into a new list; the registry's list is shared
+            tools = sorted(tools, key=lambda t: t["function"]["name"])
+            tools = orjson.loads(orjson.dumps(tools, option=orjson.OPT_SORT_KEYS))
+        _tools_cache = (tool_registry, tool_registry.version, tools)
+    return tools
+
+
+# Serializer for the whole message history in a single pydantic-core call
+_MESSAGES_ADAPTER = TypeAdapter(List[Message])
+
+# Message fields forwarded to DeepSeek; extra client fields (ids, timestamps)
+# would otherwise vary per request and break upstream prefix caching
+_DEEPSEEK_MESSAGE_FIELDS = {
+    "__all__": {"role", "content", "tool_calls", "tool_call_id", "reasoning_content"}
+}
+
+
+def to_deepseek_messages(messages: List[Message]) -> List[Dict[str, Any]]:
+    """Convert messages to only DeepSeek-recognized fields.
+
+    Args:
+        messages: Chat messages
+
+    Returns:
+        Message dicts without unset or extra fields
+    """
+    dumped: List[Dict[str, Any]] = _MESSAGES_ADAPTER.dump_python(
+        messages, include=_DEEPSEEK_MESSAGE_FIELDS, exclude_none=True
+    )
+    return dumped
+
+
+def _now_ms() -> int:
+    """Current wall-clock time in integer milliseconds."""
+    return time.time_ns() // 1_000_000
+
+
+# Thought IDs: unique per process even for thoughts opened in the same
+# millisecond (the client merges steps by ID)
+_THOUGHT_ID_PREFIX = f"thought-{os.getpid():x}-"
+_thought_ids = itertools.count(1)
+
+
+def _thought_step(
+    content: str, title: Optional[str], leads_to: Optional[str]
+) -> Dict[str, Any]:
+    """Build a thought step in its wire form.
+
+    Steps are kept as the JSON-ready dicts sent to the client rather than
+    ``ReActStep`` models, so emitting them needs no validation or dump pass.
+    The keys mirror ``ReActThought.model_dump(mode="json", by_alias=True)``,
+    except that timestamps are epoch milliseconds, as the client's
+    ``ReActStep`` type expects (like the ``tool_call`` event).
+
+    Args:
+        content: Thought content
+        title: Optional thought title
+        leads_to: What comes after this thought (response or action)
+
+    Returns:
+        Thought step dict
+    """
+    return {
+        "id": f"{_THOUGHT_ID_PREFIX}{next(_thought_ids)}",
+        "type": "thought",
+        "content": content,
+        "title": title,
+        "timestamp": _now_ms(),
+        "leadsTo": leads_to,
+    }
+
+
+def _action_step(tool_call: Dict[str, Any]) -> Dict[str, Any]:
+    """Build an action step in its wire form (see ``ReActAction``).
+
+    The step ID is derived from the tool call ID, so calls started in the
+    same millisecond still get distinct steps.
+
+    Args:
+        tool_call: The tool call being executed
+
+    Returns:
+        Action step dict
+    """
+    return {
+        "id": f"action-{tool_call['id']}",
+        "type": "action",
+        "toolCall": tool_call,
+        "timestamp": _now_ms(),
+    }
+
 
-    If last step is not a thought, creates a placeholder thought.
-    This handles cases where DeepSeek sends tool_calls without reasoning_content.
+def _observation_step(
+    tool_call_id: str, result: Any = None, error: Optional[str] = None
+) -> Dict[str, Any]:
+    """Build an observation step in its wire form (see ``ReActObservation``).
 
     Args:
-        last_step: The last ReAct step created
-        tool_name: Name of the tool being called (for placeholder context)
+        tool_call_id: ID of the tool call whose action produced this observation
+        result: Tool execution result
+        error: Error message if execution failed
 
     Returns:
-        Tuple of (updated last_step, created thought or None)
+        Observation step dict
     """
-    if last_step and last_step.type == "thought":
-        return last_step, None
+    return {
+        "id": f"observation-{tool_call_id}",
+        "type": "observation",
+        "actionId": f"action-{tool_call_id}",
+        "result": result,
+        "error": error,
+        "timestamp": _now_ms(),
+    }
+
+
+def _synthesize_thought(content: str, tool_names: List[str]) -> Dict[str, Any]:
+    """Build the thought for a turn that called tools without streaming reasoning.
+
+    The thought is derived locally from the turn's visible content so the
+    Thought -> Action pair always comes from a single completion; no extra
+    request is made to the model.
+
+    Args:
+        content: Content streamed by the model during the turn
+        tool_names: Names of the tools being called (for placeholder context)
+
+    Returns:
+        Thought step leading to the turn's actions
+    """
+    content = content.strip()
+    if content:
+        return _thought_step(content, extract_thought_title(content), "action")
 
     # Create a placeholder thought
-    placeholder_content = f"Executing tool call without explicit reasoning: {tool_name}"
-    thought = ReActThought(
-        id=f"thought-{int(time.time() * 1000)}",
-        content=placeholder_content,
-        title="Implicit reasoning",
-        leads_to="action",
+    placeholder_content = (
+        f"Executing tool call without explicit reasoning: {', '.join(tool_names)}"
     )
+    return _thought_step(placeholder_content, "Implicit reasoning", "action")
 
-    return thought, thought
+
+def _serialize_tool_result(value: Any) -> str:
+    """Serialize a tool result for the tool message sent back to DeepSeek.
+
+    Args:
+        value: Tool result
+
+    Returns:
+        JSON string, with unsupported types stringified
+    """
+    return orjson.dumps(value, default=str).decode()
+
+
+async def _coalesce_deltas(
+    chunks: AsyncIterator[Dict[str, Any]],
+) -> AsyncIterator[Tuple[str, Any]]:
+    """Merge fine-grained text deltas from a DeepSeek stream.
+
+    Consecutive ``content`` or ``reasoning_content`` pieces are buffered and
+    yielded as one delta per flush window (see ``_DELTA_FLUSH_LIMITS``), so a
+    single SSE frame carries many tokens. A window that fills before its
+    time limit doubles (up to ``_DELTA_FLUSH_MAX_CHARS``), so fast streams
+    are framed in growing batches. The next chunk is awaited only until the
+    buffered window expires, so text is not held back while the upstream
+    pauses. Whatever is buffered is flushed before a different field, before
+    tool call deltas, and when the stream ends or fails, preserving order.
+
+    Args:
+        chunks: Raw stream chunks from DeepSeek
+
+    Yields:
+        ``(field, value)`` pairs: merged text for ``"reasoning_content"`` or
+        ``"content"``, or a chunk's deltas for ``"tool_calls"``
+    """
+    # Field of the buffered parts; only read while parts is non-empty
+    field = ""
+    parts: List[str] = []
+    size = 0
+    deadline = 0.0
+    char_limits = {name: limits[0] for name, limits in _DELTA_FLUSH_LIMITS.items()}
+
+    upstream = aiter(chunks)
+    # The upstream read in flight; kept across a timed-out wait so no chunk is lost
+    pending: Optional[asyncio.Future[Dict[str, Any]]] = None
+
+    try:
+        while True:
+            if pending is None:
+                pending = asyncio.ensure_future(anext(upstream))
+            if parts:
+                done, _ = await asyncio.wait({pending}, timeout=deadline - time.monotonic())
+                if not done:
+                    yield field, "".join(parts)
+                    parts = []
+                    continue
+
+            try:
+                chunk = await pending
+            except StopAsyncIteration:
+                break
+            finally:
+                pending = None
+
+            choices = chunk.get("choices")
+            delta = choices[0].get("delta") if choices else None
+            if not delta:
+                continue
+            now = time.monotonic()
+
+            for name in ("reasoning_content", "content"):
+                text = delta.get(name)
+                if not text:
+                    continue
+
+                if parts and field != name:
+                    yield field, "".join(parts)
+                    parts = []
+                if not parts:
+                    field, size, deadline = name, 0, now + _DELTA_FLUSH_LIMITS[name][1]
+
+                parts.append(text)
+                size += len(text)
+                max_chars = char_limits[name]
+                if size >= max_chars:
+                    char_limits[name] = min(max_chars * 2, _DELTA_FLUSH_MAX_CHARS)
+                if size >= max_chars or now >= deadline:
+                    yield field, "".join(parts)
+                    parts = []
+
+            delta_tool_calls = delta.get("tool_calls")
+            if delta_tool_calls:
+                if parts:
+                    yield field, "".join(parts)
+                    parts = []
+                yield "tool_calls", delta_tool_calls
+    except Exception:
+        # Text received before an upstream failure still reaches the client
+        if parts:
+            yield field, "".join(parts)
+        raise
+    finally:
+        if pending is not None:
+            # Closed mid-wait (e.g. the client disconnected); stop the read
+            pending.cancel()
+            if pending.done() and not pending.cancelled():
+                pending.exception()  # Mark a finished read's outcome as retrieved
+
+    if parts:
+        yield field, "".join(parts)
+
+
+@dataclass(slots=True)
+class _PartialCall:
+    """A tool call being assembled from streamed deltas.
+
+    Attributes:
+        id: Tool call ID
+        name: Tool name
+        arguments: JSON arguments received so far
+        tool: Registered tool, resolved once the call is complete
+    """
+
+    id: str
+    name: str = ""
+    arguments: bytearray = field(default_factory=bytearray)
+    tool: Optional[BaseTool] = None
+
+    def parse_arguments(self) -> Dict[str, Any]:
+        """Parse the accumulated JSON arguments in a single pass.
+
+        Returns:
+            Tool parameters; empty if there are none or they are not valid JSON
+        """
+        if not self.arguments or self.arguments == b"{}":
+            return {}
+        try:
+            parameters: Dict[str, Any] = orjson.loads(self.arguments)
+        except orjson.JSONDecodeError:
+            return {}
+        return parameters
+
+    def to_message(self) -> Dict[str, Any]:
+        """Convert the completed call to the OpenAI tool call format.
+
+        Arguments are accumulated as bytes while streaming, so the final
+        shape is built once per call when the turn ends rather than kept
+        up to date on every delta.
+
+        Returns:
+            Tool call dict for the assistant message
+        """
+        return {
+            "id": self.id,
+            "type": "function",
+            "function": {"name": self.name, "arguments": self.arguments.decode()},
+        }
+
+
+def _group_tool_calls(
+    tool_calls: List[_PartialCall],
+    tool_registry: ToolRegistry,
+) -> List[List[_PartialCall]]:
+    """Group tool calls into batches that can run concurrently.
+
+    Consecutive calls to parallel-safe (or unknown) tools share a batch; calls
+    to tools with side effects run alone so their ordering is preserved. Each
+    call's tool is looked up here once and stored on the call for execution.
+
+    Args:
+        tool_calls: Tool calls in the order the model emitted them
+        tool_registry: Tool registry used to look up tools
+
+    Returns:
+        Ordered list of tool call batches
+    """
+    groups: List[List[_PartialCall]] = []
+    current: List[_PartialCall] = []
+    get_tool = tool_registry.get
+
+    for tc in tool_calls:
+        tc.tool = tool = get_tool(tc.name)
+        if tool is None or tool.parallel_safe:
+            current.append(tc)
+            continue
+
+        if current:
+            groups.append(current)
+            current = []
+        groups.append([tc])
+
+    if current:
+        groups.append(current)
+
+    return groups
+
+
+async def _run_tool(
+    tool_call_id: str,
+    tool_name: str,
+    tool: Optional[BaseTool],
+    parameters: Dict[str, Any],
+    log: structlog.stdlib.BoundLogger,
+) -> Tuple[str, ToolResult]:
+    """Execute a single tool call, converting failures into an error result.
+
+    Args:
+        tool_call_id: ID of the tool call
+        tool_name: Name of the requested tool
+        tool: Tool instance, or None if not registered
+        parameters: Parsed tool arguments
+        log: Logger bound to the chat request
+
+    Returns:
+        Tuple of (tool_call_id, tool execution result)
+    """
+    if tool is None:
+        return tool_call_id, ToolResult(success=False, error=f"Tool '{tool_name}' not found")
+
+    try:
+        return tool_call_id, await tool.execute(**parameters)
+    except Exception as e:
+        log.error("Tool execution error: %s", e, tool_name=tool_name)
+        return tool_call_id, ToolResult(success=False, error=str(e))
 
 
 async def chat_stream(
     request: ChatRequest,
     client: DeepSeekClient,
     request_id: str,
-) -> AsyncIterator[str]:
+) -> AsyncIterator[bytes]:
     """Generate chat stream with ReAct pattern.
 
     Args:
@@ -157,378 +559,353 @@ async def chat_stream(
         request_id: Request ID for logging
 
     Yields:
-        SSE formatted strings
+        SSE formatted bytes
     """
-    logger = get_request_logger(request_id)
+    # Binding the module logger is cheap; building a new one per request is not
+    log = logger.bind(request_id=request_id)
     tool_registry = get_tool_registry()
 
     try:
         # Get tools from registry
-        tools = tool_registry.get_definitions() if tool_registry.list_tools() else None
+        tools = _get_tool_definitions(tool_registry)
 
-        logger.info(
+        log.info(
             "Starting chat stream",
             message_count=len(request.messages),
             has_tools=bool(tools),
         )
 
         # Current messages state (updated with each tool call)
-        # Convert Pydantic models to dicts, ONLY include fields DeepSeek recognizes
-        def to_deepseek_message(msg: Message) -> Dict[str, Any]:
-            """Convert message to only DeepSeek-recognized fields."""
-            return msg.model_dump(exclude_none=True)
-
-        current_messages: List[Dict[str, Any]] = [to_deepseek_message(m) for m in request.messages]
+        current_messages: List[Dict[str, Any]] = to_deepseek_messages(request.messages)
 
         # Track the last ReAct step for in-place updates during streaming
-        last_step: Optional[ReActStep] = None
+        last_step: Optional[Dict[str, Any]] = None
 
-        # Main ReAct loop
-        iteration = 0
+        # Reasoning and thought steps are only streamed to clients that want them
+        include_reasoning = request.include_reasoning
+
+        # Fallback tool call IDs are request-scoped sequence numbers
+        tool_seq = 0
+
+        # Main ReAct loop; each iteration is exactly one LLM call producing
+        # thought and actions together
         max_iterations = 10
 
-        while iteration < max_iterations:
-            iteration += 1
-            logger.info(f"ReAct iteration {iteration}/{max_iterations}")
+        for iteration in range(1, max_iterations + 1):
+            log.info("ReAct iteration %d/%d", iteration, max_iterations)
 
             # Stream response from DeepSeek
-            current_content = ""
-            current_reasoning = ""
-            tool_calls: List[Dict[str, Any]] = []
-
-            async for chunk in client.chat(
+            # Streamed text, joined once the turn's stream ends
+            content_parts: List[str] = []
+            reasoning_parts: List[str] = []
+            # Leading reasoning that thought titles are extracted from
+            reasoning_head = ""
+            # Tool calls being streamed, keyed by their index in the turn
+            partial_calls: Dict[int, _PartialCall] = {}
+            # Whether the open thought has deltas not yet sent as a full react_step
+            thought_dirty = False
+            # Length of reasoning_head at the last title extraction
+            title_checked_len = 0
+
+            stream = client.chat(
                 messages=current_messages,
                 tools=tools,
                 stream=True,
                 max_tokens=request.max_tokens,
                 system_prompt=REACT_SYSTEM_PROMPT,
-            ):
-                # Extract content from chunk
-                delta = chunk.get("choices", [{}])[0].get("delta", {})
-
-                if delta.get("content"):
-                    content = delta["content"]
-                    current_content += content
-                    event = StreamEvent(
-                        type="content",
-                        data=content,
-                    )
-                    yield format_sse(event)
-
-                if delta.get("reasoning_content"):
-                    reasoning = delta["reasoning_content"]
-                    current_reasoning += reasoning
-
-                    if current_reasoning:
+            )
+            async for kind, value in _coalesce_deltas(stream):
+                if kind == "content":
+                    content_parts.append(value)
+                    yield sse("content", value)
+
+                elif kind == "reasoning_content":
+                    reasoning = value
+                    # Always captured: the next iteration must send it back to DeepSeek
+                    reasoning_parts.append(reasoning)
+
+                    if include_reasoning:
                         # Stream the reasoning
-                        event = StreamEvent(
-                            type="reasoning",
-                            data=reasoning,
-                        )
-                        yield format_sse(event)
-
-                        # Extract a title for the thought
-                        thought_title = extract_thought_title(current_reasoning)
-
-                        if last_step and last_step.type == "thought":
-                            # Update existing thought in-place
-                            last_step.content = current_reasoning
-                            if thought_title:
-                                last_step.title = thought_title
-                            event = StreamEvent(
-                                type="react_step",
-                                data=last_step.model_dump(mode="json", by_alias=True),
-                            )
-                            yield format_sse(event)
+                        yield sse("reasoning", reasoning)
+
+                        # Re-extract the title only at sentence/line boundaries or
+                        # after enough new text, not on every token, and never once
+                        # the title window is full
+                        thought_title = None
+                        if len(reasoning_head) < _TITLE_WINDOW_CHARS:
+                            reasoning_head = (reasoning_head + reasoning)[:_TITLE_WINDOW_CHARS]
+                            if (
+                                len(reasoning_head) - title_checked_len >= _TITLE_RECHECK_CHARS
+                                or len(reasoning_head) == _TITLE_WINDOW_CHARS
+                                or any(t in reasoning for t in _TITLE_BOUNDARIES)
+                                or not (last_step and last_step["type"] == "thought")
+                            ):
+                                thought_title = extract_thought_title(reasoning_head)
+                                title_checked_len = len(reasoning_head)
+
+                        if last_step and last_step["type"] == "thought":
+                            # Update existing thought in-place and stream only the delta;
+                            # the full step is re-sent when its title changes (rare, as
+                            # titles come from the first line) and once the thought closes
+                            if thought_title and thought_title != last_step["title"]:
+                                last_step["title"] = thought_title
+                                last_step["content"] = "".join(reasoning_parts)
+                                thought_dirty = False
+                                yield sse("react_step", last_step)
+                            else:
+                                thought_dirty = True
+                                yield sse(
+                                    "react_step_delta",
+                                    {
+                                        "id": last_step["id"],
+                                        "field": "content",
+                                        "delta": reasoning,
+                                    },
+                                )
                         else:
-                            # No existing thought - create new one
-                            thought = ReActThought(
-                                id=f"thought-{int(time.time() * 1000)}",
-                                content=current_reasoning,
-                                title=thought_title,
-                                leads_to="action" if delta.get("tool_calls") else "response",
+                            # No existing thought - create new one; leadsTo is
+                            # settled when the thought closes
+                            last_step = _thought_step(
+                                "".join(reasoning_parts), thought_title, "response"
                             )
-                            last_step = thought
-                            event = StreamEvent(
-                                type="react_step",
-                                data=thought.model_dump(mode="json", by_alias=True),
-                            )
-                            yield format_sse(event)
+                            yield sse("react_step", last_step)
 
-                # Handle tool calls
-                if delta.get("tool_calls"):
-                    for tc in delta["tool_calls"]:
+                else:
+                    # Handle tool calls
+                    for tc in value:
                         idx = tc.get("index")
                         if idx is not None:
-                            # Ensure array has space
-                            while len(tool_calls) <= idx:
-                                tool_calls.append({
-                                    "id": f"tool-{int(uuid.uuid4())}-{len(tool_calls)}",
-                                    "name": "",
-                                    "arguments": "",
-                                })
+                            # Allocate call state on first sighting of an index
+                            call = partial_calls.get(idx)
+                            if call is None:
+                                tool_seq += 1
+                                call = _PartialCall(f"tool-{request_id}-{tool_seq}")
+                                partial_calls[idx] = call
 
                             # Update with ID if provided
                             if tc.get("id"):
-                                tool_calls[idx]["id"] = tc["id"]
+                                call.id = tc["id"]
 
-                            # Update name
-                            if tc.get("function", {}).get("name"):
-                                tool_calls[idx]["name"] = tc["function"]["name"]
+                            function = tc.get("function") or {}
 
-                            # Accumulate arguments
-                            tool_calls[idx]["arguments"] += (
-                                tc.get("function", {}).get("arguments", "")
+                            # Update name
+                            if function.get("name"):
+                                call.name = function["name"]
+
+                            # Accumulate arguments (bytearray avoids quadratic str +=)
+                            arguments = function.get("arguments")
+                            if arguments:
+                                call.arguments.extend(arguments.encode())
+
+            current_content = "".join(content_parts)
+            current_reasoning = "".join(reasoning_parts)
+            tool_calls = [partial_calls[idx] for idx in sorted(partial_calls)]
+
+            # Close the turn's thought with its full, final state. The thought and
+            # its actions come from the same completion, so a turn that called tools
+            # without reasoning gets a locally synthesized thought instead.
+            if include_reasoning:
+                if last_step and last_step["type"] == "thought":
+                    leads_to = "action" if tool_calls else "response"
+                    if thought_dirty or last_step["leadsTo"] != leads_to:
+                        if title_checked_len != len(reasoning_head):
+                            last_step["title"] = (
+                                extract_thought_title(reasoning_head) or last_step["title"]
                             )
+                        last_step["content"] = current_reasoning
+                        last_step["leadsTo"] = leads_to
+                        yield sse("react_step", last_step)
+                elif tool_calls:
+                    last_step = _synthesize_thought(
+                        current_content, [tc.name for tc in tool_calls]
+                    )
+                    yield sse("react_step", last_step)
 
             # If no tool calls, we're done
             if not tool_calls:
-                logger.info("No tool calls, finishing chat")
+                log.info("No tool calls, finishing chat")
                 break
 
-            logger.info(f"Got {len(tool_calls)} tool call(s)")
+            log.info("Got %d tool call(s)", len(tool_calls))
 
             # Add assistant message with tool calls to conversation
             assistant_msg: Dict[str, Any] = {
                 "role": "assistant",
                 "content": current_content,
                 "reasoning_content": current_reasoning,
-                "tool_calls": [
-                    {
-                        "id": tc["id"],
-                        "type": "function",
-                        "function": {
-                            "name": tc["name"],
-                            "arguments": tc["arguments"],
-                        },
-                    }
-                    for tc in tool_calls
-                ],
+                "tool_calls": [tc.to_message() for tc in tool_calls],
             }
             current_messages.append(assistant_msg)
 
-            # Execute each tool call
-            for tc in tool_calls:
-                tool_call_id = tc["id"]
-                tool_name = tc["name"]
+            # Execute tool calls; consecutive parallel-safe calls run concurrently
+            for group in _group_tool_calls(tool_calls, tool_registry):
+                tasks: List["asyncio.Task[Tuple[str, ToolResult]]"] = []
 
-                # Parse arguments
-                try:
-                    parameters = json.loads(tc.get("arguments", "{}"))
-                except json.JSONDecodeError:
-                    parameters = {}
-
-                # Create tool call object for streaming
-                tool_call_data = {
-                    "id": tool_call_id,
-                    "name": tool_name,
-                    "parameters": parameters,
-                    "timestamp": int(uuid.uuid4().time_low),
-                }
-
-                # Send tool_call event
-                event = StreamEvent(
-                    type="tool_call",
-                    data=tool_call_data,
-                )
-                yield format_sse(event)
-
-                # Ensure a thought exists before creating an action
-                last_step, new_thought = _ensure_thought_exists(last_step, tool_name)
-
-                # If a placeholder thought was created, yield it
-                if new_thought:
-                    event = StreamEvent(
-                        type="react_step",
-                        data=new_thought.model_dump(mode="json", by_alias=True),
+                for tc in group:
+                    tool_call_id = tc.id
+                    tool_name = tc.name
+
+                    parameters = tc.parse_arguments()
+
+                    # Create tool call object for streaming
+                    tool_call_data = {
+                        "id": tool_call_id,
+                        "name": tool_name,
+                        "parameters": parameters,
+                        "timestamp": _now_ms(),
+                    }
+
+                    # Send tool_call event
+                    yield sse("tool_call", tool_call_data)
+
+                    # Record as action
+                    last_step = _action_step(tool_call_data)
+                    yield sse("react_step", last_step)
+
+                    tasks.append(
+                        asyncio.create_task(
+                            _run_tool(tool_call_id, tool_name, tc.tool, parameters, log)
+                        )
                     )
-                    yield format_sse(event)
-
-                # Record as action
-                action = ReActAction(
-                    id=f"action-{int(time.time() * 1000)}",
-                    tool_call=tool_call_data,
-                )
-                last_step = action
-                event = StreamEvent(
-                    type="react_step",
-                    data=action.model_dump(mode="json", by_alias=True),
-                )
-                yield format_sse(event)
-
-                # Get and execute the tool
-                tool = tool_registry.get(tool_name) if tool_registry else None
-
-                if tool:
-                    try:
-                        result = await tool.execute(**parameters)
+
+                # Report each result of the group as soon as it completes
+                tool_messages: Dict[str, Dict[str, Any]] = {}
+                try:
+                    for next_done in asyncio.as_completed(tasks):
+                        tool_call_id, result = await next_done
 
                         if result.success:
                             # Send tool_result event
-                            event = StreamEvent(
-                                type="tool_result",
-                                data={
+                            yield sse(
+                                "tool_result",
+                                {
                                     "toolCallId": tool_call_id,
                                     "result": result.result,
                                 },
                             )
-                            yield format_sse(event)
 
                             # Record as observation
-                            observation = ReActObservation(
-                                id=f"observation-{int(time.time() * 1000)}",
-                                action_id=action.id,
-                                result=result.result,
+                            last_step = _observation_step(tool_call_id, result=result.result)
+                            content = (
+                                _serialize_tool_result(result.result)
+                                if result.result
+                                else ""
                             )
-                            last_step = observation
-                            event = StreamEvent(
-                                type="react_step",
-                                data=observation.model_dump(mode="json", by_alias=True),
-                            )
-                            yield format_sse(event)
-
-                            # Add tool message
-                            current_messages.append({
-                                "role": "tool",
-                                "tool_call_id": tool_call_id,
-                                "content": json.dumps(result.result) if result.result else "",
-                            })
                         else:
                             # Send tool_error event
-                            event = StreamEvent(
-                                type="tool_error",
-                                data={
+                            yield sse(
+                                "tool_error",
+                                {
                                     "toolCallId": tool_call_id,
                                     "error": result.error or "Unknown error",
                                 },
                             )
-                            yield format_sse(event)
 
                             # Record as observation with error
-                            observation = ReActObservation(
-                                id=f"observation-{int(time.time() * 1000)}",
-                                action_id=action.id,
-                                error=result.error,
-                            )
-                            last_step = observation
-                            event = StreamEvent(
-                                type="react_step",
-                                data=observation.model_dump(mode="json", by_alias=True),
-                            )
-                            yield format_sse(event)
-
-                            # Add tool message with error
-                            current_messages.append({
-                                "role": "tool",
-                                "tool_call_id": tool_call_id,
-                                "content": f"Error: {result.error}" if result.error else "Error",
-                            })
-
-                    except Exception as e:
-                        logger.error(f"Tool execution error: {e}")
-                        event = StreamEvent(
-                            type="tool_error",
-                            data={
-                                "toolCallId": tool_call_id,
-                                "error": str(e),
-                            },
-                        )
-                        yield format_sse(event)
+                            last_step = _observation_step(tool_call_id, error=result.error)
+                            content = f"Error: {result.error}" if result.error else "Error"
 
-                        observation = ReActObservation(
-                            id=f"observation-{int(time.time() * 1000)}",
-                            action_id=action.id,
-                            error=str(e),
-                        )
-                        last_step = observation
-                        event = StreamEvent(
-                            type="react_step",
-                            data=observation.model_dump(mode="json", by_alias=True),
-                        )
-                        yield format_sse(event)
+                        yield sse("react_step", last_step)
 
-                        current_messages.append({
+                        tool_messages[tool_call_id] = {
                             "role": "tool",
                             "tool_call_id": tool_call_id,
-                            "content": f"Error: {e}",
-                        })
-                else:
-                    # Tool not found
-                    error_msg = f"Error: Tool '{tool_name}' not found"
-                    event = StreamEvent(
-                        type="tool_error",
-                        data={
-                            "toolCallId": tool_call_id,
-                            "error": error_msg,
-                        },
-                    )
-                    yield format_sse(event)
+                            "content": content,
+                        }
+                finally:
+                    for task in tasks:
+                        task.cancel()
 
-                    observation = ReActObservation(
-                        id=f"observation-{int(time.time() * 1000)}",
-                        action_id=action.id,
-                        error=error_msg,
-                    )
-                    last_step = observation
-                    event = StreamEvent(
-                        type="react_step",
-                        data=observation.model_dump(mode="json", by_alias=True),
-                    )
-                    yield format_sse(event)
-
-                    current_messages.append({
-                        "role": "tool",
-                        "tool_call_id": tool_call_id,
-                        "content": error_msg,
-                    })
+                # Add tool messages in call order
+                current_messages.extend(tool_messages[tc.id] for tc in group)
 
         # Send done event
-        done_event = StreamEvent(
-            type="done",
-            data=None,
-        )
-        yield format_sse(done_event)
+        yield _DONE_FRAME
 
-        logger.info("Chat stream completed")
+        log.info("Chat stream completed")
 
     except DeepSeekError as e:
-        logger.error(f"DeepSeek error: {e}")
-        error_event = StreamEvent(
-            type="error",
-            data={"message": str(e)},
-        )
-        yield format_sse(error_event)
+        log.error("DeepSeek error: %s", e)
+        yield _ERROR_FRAME_PREFIX + orjson.dumps(str(e)) + _ERROR_FRAME_SUFFIX
 
     except Exception as e:
-        logger.error(f"Unexpected error: {e}")
-        error_event = StreamEvent(
-            type="error",
-            data={"message": "Internal server error"},
-        )
-        yield format_sse(error_event)
+        log.error("Unexpected error: %s", e)
+        yield _INTERNAL_ERROR_FRAME
 
 
-@router.post("/chat")
+def _request_body_schema(model: Type[BaseModel]) -> Dict[str, Any]:
+    """Build an OpenAPI request body for a model parsed outside FastAPI.
+
+    Args:
+        model: Model describing the JSON body
+
+    Returns:
+        Request body object with the model schema inlined
+    """
+    schema = model.model_json_schema()
+    defs = schema.pop("$defs", {})
+
+    def inline(node: Any) -> Any:
+        if isinstance(node, dict):
+            if "$ref" in node:
+                return inline(defs[node["$ref"].rsplit("/", 1)[-1]])
+            return {key: inline(value) for key, value in node.items()}
+        if isinstance(node, list):
+            return [inline(value) for value in node]
+        return node
+
+    return {
+        "required": True,
+        "content": {"application/json": {"schema": inline(schema)}},
+    }
+
+
+async def _parse_chat_request(http_request: Request) -> ChatRequest:
+    """Validate the chat request straight from the raw JSON body.
+
+    pydantic-core parses and validates the bytes in one pass, instead of
+    FastAPI decoding them into Python objects first and validating those.
+
+    Args:
+        http_request: Incoming HTTP request
+
+    Returns:
+        Validated chat request
+
+    Raises:
+        RequestValidationError: If the body is not a valid chat request
+    """
+    body = await http_request.body()
+    try:
+        return ChatRequest.model_validate_json(body)
+    except ValidationError as e:
+        errors = [
+            {**error, "loc": ("body", *error["loc"])}
+            for error in e.errors(include_url=False)
+        ]
+        raise RequestValidationError(errors, body=body) from e
+
+
+@router.post(
+    "/chat",
+    openapi_extra={"requestBody": _request_body_schema(ChatRequest)},
+)
 async def chat(
-    request: ChatRequest,
-) -> StreamingResponse:
+    request: ChatRequest = Depends(_parse_chat_request),
+    client: DeepSeekClient = Depends(get_client),
+) -> SSEResponse:
     """Chat endpoint with streaming support and ReAct pattern.
 
     Args:
         request: Chat request with messages
+        client: Shared DeepSeek client
 
     Returns:
         Streaming response with SSE events
     """
-    request_id = str(uuid.uuid4())
-    client = DeepSeekClient()
+    request_id = uuid.uuid4().hex
 
-    return StreamingResponse(
+    return SSEResponse(
         chat_stream(request, client, request_id),
-        media_type="text/event-stream",
-        headers={
-            "Cache-Control": "no-cache",
-            "Connection": "keep-alive",
-            "X-Request-ID": request_id,
-        },
+        headers={"X-Request-ID": request_id},
     )
@@ -1,17 +1,21 @@
 """Tools endpoint."""
 
-from typing import Any
+from typing import Any, Optional, Tuple
 
-from fastapi import APIRouter, HTTPException, status
+import orjson
+from fastapi import APIRouter, Response
 from pydantic import BaseModel
 
-from gemini_chat_backend.tools.registry import get_tool_registry
+from gemini_chat_backend.tools.registry import ToolRegistry, get_tool_registry
 from gemini_chat_backend.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
 router = APIRouter()
 
+# Encoded /tools response, cached per registry instance and version
+_tools_payload: Tuple[Optional[ToolRegistry], int, bytes] = (None, -1, b"")
+
 
 class ToolExecuteRequest(BaseModel):
     """Tool execution request."""
@@ -28,26 +32,43 @@ class ToolExecuteResponse(BaseModel):
     error: str | None = None
 
 
+def _get_tools_payload(registry: ToolRegistry) -> bytes:
+    """Get the encoded tool list, rebuilding only when the registry changes.
+
+    Args:
+        registry: Tool registry to list
+
+    Returns:
+        JSON body for the tools listing
+    """
+    global _tools_payload
+    cached_registry, version, payload = _tools_payload
+    if cached_registry is not registry or version != registry.version:
+        payload = orjson.dumps({
+            "tools": [
+                {
+                    "name": tool.name,
+                    "description": tool.description,
+                    "parameters": tool.parameters,
+                }
+                for tool in registry.list_tools()
+            ]
+        })
+        _tools_payload = (registry, registry.version, payload)
+    return payload
+
+
 @router.get("/tools", tags=["tools"])
-async def list_tools() -> dict[str, Any]:
+async def list_tools() -> Response:
     """List available tools.
 
     Returns:
         List of available tools
     """
-    registry = get_tool_registry()
-    tools = registry.list_tools()
-
-    return {
-        "tools": [
-            {
-                "name": tool.name,
-                "description": tool.description,
-                "parameters": tool.parameters,
-            }
-            for tool in tools
-        ]
-    }
+    return Response(
+        content=_get_tools_payload(get_tool_registry()),
+        media_type="application/json",
+    )
 
 
 @router.post("/tools/execute", tags=["tools"])
@@ -60,29 +81,25 @@ async def execute_tool(
         request: Tool execution request
 
     Returns:
-        Tool execution response
-
-    Raises:
-        HTTPException: If tool execution fails
+        Tool execution response (failures are reported in the body)
     """
-    registry = get_tool_registry()
-    tool = registry.get(request.tool_name)
+    tool = get_tool_registry().get(request.tool_name)
 
     if not tool:
-        logger.warning(f"Tool not found: {request.tool_name}")
+        logger.warning("Tool not found: %s", request.tool_name)
         return ToolExecuteResponse(
             success=False,
             error=f"Tool '{request.tool_name}' not found",
         )
 
     try:
-        logger.info(f"Executing tool: {request.tool_name}")
+        logger.info("Executing tool: %s", request.tool_name)
         result = await tool.execute(**request.parameters)
 
         if result.success:
-            logger.info(f"Tool executed successfully: {request.tool_name}")
+            logger.info("Tool executed successfully: %s", request.tool_name)
         else:
-            logger.warning(f"Tool execution failed: {request.tool_name} - {result.error}")
+            logger.warning("Tool execution failed: %s - %s", request.tool_name, result.error)
 
         return ToolExecuteResponse(
             success=result.success,
@@ -91,7 +108,7 @@ async def execute_tool(
         )
 
     except Exception as e:
-        logger.error(f"Unexpected error executing tool {request.tool_name}: {e}")
+        logger.error("Unexpected error executing tool %s: %s", request.tool_name, e)
         return ToolExecuteResponse(
             success=False,
             error=str(e),
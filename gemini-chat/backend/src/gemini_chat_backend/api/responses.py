@@ -0,0 +1,112 @@
+"""Custom response classes."""
+
+from typing import AsyncIterator, Mapping, Optional
+
+import anyio
+from anyio.streams.memory import MemoryObjectSendStream
+from starlette.responses import Response
+from starlette.types import Receive, Scope, Send
+
+# Headers every SSE stream needs so proxies neither cache nor buffer it
+SSE_HEADERS = {
+    "Cache-Control": "no-cache",
+    "Connection": "keep-alive",
+    "X-Accel-Buffering": "no",
+}
+
+# Comment frame sent on idle streams so proxies do not time out the connection
+SSE_PING_FRAME = b": ping\n\n"
+SSE_PING_INTERVAL = 15.0
+
+# Frames read ahead of the client, so a slow reader does not stall the producer
+SSE_BUFFER_SIZE = 64
+
+
+class SSEResponse(Response):
+    """Server-sent events response written directly to the ASGI ``send`` callable.
+
+    The iterator is drained by its own task into a queue of ``buffer_size``
+    frames, so a briefly slow client does not stall the producer (and with it
+    the upstream model stream). The queue is bounded, so a stuck client still
+    applies backpressure. Routes using it should not be wrapped in
+    ``BaseHTTPMiddleware``, which re-buffers the body in an unbounded queue;
+    use pure ASGI middleware (like ``CORSMiddleware``) instead.
+
+    While no frame has been sent for ``ping_interval`` seconds (e.g. during a
+    long tool call), an SSE comment is sent as a keep-alive; clients ignore it.
+
+    Attributes:
+        body_iterator: Async iterator of pre-encoded SSE frames
+        ping_interval: Seconds of idleness before a keep-alive, or None to disable
+        buffer_size: Frames to read ahead of the client, or 0 to send inline
+    """
+
+    media_type = "text/event-stream"
+
+    def __init__(
+        self,
+        content: AsyncIterator[bytes],
+        headers: Optional[Mapping[str, str]] = None,
+        ping_interval: Optional[float] = SSE_PING_INTERVAL,
+        buffer_size: int = SSE_BUFFER_SIZE,
+    ):
+        self.body_iterator = content
+        self.ping_interval = ping_interval
+        self.buffer_size = buffer_size
+        self.status_code = 200
+        self.background = None
+        self.init_headers({**SSE_HEADERS, **(headers or {})})
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Stream the body, stopping early if the client disconnects."""
+        send_lock = anyio.Lock()
+        last_sent = anyio.current_time()
+        finished = False
+
+        async def send_body(
+            chunk: bytes, more_body: bool = True, idle_for: float = 0.0
+        ) -> None:
+            nonlocal last_sent, finished
+            async with send_lock:
+                if finished or anyio.current_time() - last_sent < idle_for:
+                    return
+                await send({"type": "http.response.body", "body": chunk, "more_body": more_body})
+                last_sent = anyio.current_time()
+                finished = not more_body
+
+        async with anyio.create_task_group() as task_group:
+
+            async def stream() -> None:
+                await send({
+                    "type": "http.response.start",
+                    "status": self.status_code,
+                    "headers": self.raw_headers,
+                })
+                if self.ping_interval is not None:
+                    task_group.start_soon(ping, self.ping_interval)
+                chunks: AsyncIterator[bytes] = self.body_iterator
+                if self.buffer_size > 0:
+                    send_stream, chunks = anyio.create_memory_object_stream[bytes](self.buffer_size)
+                    task_group.start_soon(fill, send_stream)
+                async for chunk in chunks:
+                    await send_body(chunk)
+                await send_body(b"", more_body=False)
+                task_group.cancel_scope.cancel()
+
+            async def fill(send_stream: MemoryObjectSendStream[bytes]) -> None:
+                async with send_stream:
+                    async for chunk in self.body_iterator:
+                        await send_stream.send(chunk)
+
+            async def ping(interval: float) -> None:
+                while True:
+                    await anyio.sleep(last_sent + interval - anyio.current_time())
+                    await send_body(SSE_PING_FRAME, idle_for=interval)
+
+            async def watch_disconnect() -> None:
+                while (await receive())["type"] != "http.disconnect":
+                    pass
+                task_group.cancel_scope.cancel()
+
+            task_group.start_soon(stream)
+            task_group.start_soon(watch_disconnect)
@@ -1,7 +1,7 @@
 """Configuration management for Gemini Chat Backend."""
 
 import json
-from typing import List, Union
+from typing import List, Literal, Union
 
 from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -39,6 +39,19 @@ class Settings(BaseSettings):
     DEEPSEEK_API_URL: str = "https://api.deepseek.com/v1/chat/completions"
     DEEPSEEK_MODEL: str = "deepseek-reasoner"
 
+    # DeepSeek connection pool (shared by all requests)
+    DEEPSEEK_TIMEOUT: float = 120.0
+    DEEPSEEK_MAX_CONNECTIONS: int = 256
+    DEEPSEEK_MAX_KEEPALIVE_CONNECTIONS: int = 64
+    DEEPSEEK_KEEPALIVE_EXPIRY: float = 60.0
+    DEEPSEEK_HTTP2: bool = False  # requires the "http2" extra
+    # Transport for streamed completions; "aiohttp" requires the "aiohttp" extra
+    DEEPSEEK_HTTP_BACKEND: Literal["httpx", "aiohttp"] = "httpx"
+
+    # Exact-match response cache (0 disables; completions are not deterministic)
+    DEEPSEEK_CACHE_TTL: float = 0.0
+    DEEPSEEK_CACHE_MAX_ENTRIES: int = 256
+
     # Tool Configuration
     TOOL_WORKING_DIRECTORY: str = "."
     TOOL_READ_ONLY_MODE: bool = Field(default=False, description="Enable read-only tool restrictions")
@@ -46,6 +59,8 @@ class Settings(BaseSettings):
     # Server Configuration
     HOST: str = "0.0.0.0"
     PORT: int = 8000
+    DEBUG: bool = False  # auto-reload on code changes, single process
+    WORKERS: int = 1
 
     # Logging Configuration
     LOG_LEVEL: str = "INFO"
@@ -1,11 +1,13 @@
 """DeepSeek API client for Gemini Chat Backend."""
 
-import json
-from typing import Any, AsyncIterator, Dict, List, Optional
+import hashlib
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 
 import httpx
+import orjson
 
 from gemini_chat_backend.config import settings
+from gemini_chat_backend.core.llm_cache import LLMCache
 from gemini_chat_backend.utils.logging import get_logger
 
 logger = get_logger(__name__)
@@ -17,6 +19,28 @@ class DeepSeekError(Exception):
     pass
 
 
+async def _split_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    """Split a byte stream into lines without decoding it.
+
+    Args:
+        chunks: Response body chunks
+
+    Yields:
+        Lines without their ``\\n`` or ``\\r\\n`` endings
+    """
+    buffer = bytearray()
+    async for chunk in chunks:
+        buffer.extend(chunk)
+        start = 0
+        while (end := buffer.find(b"\n", start)) != -1:
+            yield bytes(buffer[start:end]).rstrip(b"\r")
+            start = end + 1
+        del buffer[:start]
+
+    if buffer:
+        yield bytes(buffer).rstrip(b"\r")
+
+
 class DeepSeekClient:
     """Client for DeepSeek API."""
 
@@ -42,12 +66,80 @@ class DeepSeekClient:
             "Content-Type": "application/json",
         }
 
+        # HTTP client shared by all requests, created on first use
+        self._http: Optional[httpx.AsyncClient] = None
+        # aiohttp session for streaming when DEEPSEEK_HTTP_BACKEND is "aiohttp"
+        self._session: Any = None
+
+        # Responses to exact-match requests, when DEEPSEEK_CACHE_TTL is set
+        self._cache: Optional[LLMCache] = (
+            LLMCache(settings.DEEPSEEK_CACHE_TTL, settings.DEEPSEEK_CACHE_MAX_ENTRIES)
+            if settings.DEEPSEEK_CACHE_TTL > 0
+            else None
+        )
+
+        # Encoded JSON of long-lived payload parts (system prompt, tool
+        # definitions), keyed by object identity
+        self._encoded: Dict[int, Tuple[Any, bytes]] = {}
+
         logger.info(
             "DeepSeek client initialized",
             model=self.model,
             api_url=self.api_url,
         )
 
+    def _get_http(self) -> httpx.AsyncClient:
+        """Get the shared HTTP client, creating it if needed.
+
+        Returns:
+            HTTP client whose connection pool is reused across requests
+        """
+        if self._http is None or self._http.is_closed:
+            self._http = httpx.AsyncClient(
+                headers=self.headers,
+                timeout=settings.DEEPSEEK_TIMEOUT,
+                http2=settings.DEEPSEEK_HTTP2,
+                limits=httpx.Limits(
+                    max_connections=settings.DEEPSEEK_MAX_CONNECTIONS,
+                    max_keepalive_connections=settings.DEEPSEEK_MAX_KEEPALIVE_CONNECTIONS,
+                    keepalive_expiry=settings.DEEPSEEK_KEEPALIVE_EXPIRY,
+                ),
+            )
+        return self._http
+
+    def _get_session(self) -> Any:
+        """Get the shared aiohttp session, creating it if needed.
+
+        Returns:
+            aiohttp.ClientSession whose connector is reused across requests
+        """
+        if self._session is None or self._session.closed:
+            import aiohttp
+
+            self._session = aiohttp.ClientSession(
+                headers=self.headers,
+                # Like httpx's timeout, bound each read rather than the whole stream
+                timeout=aiohttp.ClientTimeout(
+                    total=None,
+                    sock_connect=settings.DEEPSEEK_TIMEOUT,
+                    sock_read=settings.DEEPSEEK_TIMEOUT,
+                ),
+                connector=aiohttp.TCPConnector(
+                    limit=settings.DEEPSEEK_MAX_CONNECTIONS,
+                    keepalive_timeout=settings.DEEPSEEK_KEEPALIVE_EXPIRY,
+                ),
+            )
+        return self._session
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP clients and their pooled connections."""
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
     async def chat(
         self,
         messages: List[Dict[str, Any]],
@@ -71,8 +163,8 @@ class DeepSeekClient:
         Raises:
             DeepSeekError: If API request fails
         """
-        # Prepare messages with system prompt if provided
-        prepared_messages = self._prepare_messages(messages, system_prompt)
+        # Prepare messages; the system prompt is spliced in pre-encoded
+        prepared_messages = self._prepare_messages(messages)
 
         # Build request payload
         payload: Dict[str, Any] = {
@@ -89,59 +181,100 @@ class DeepSeekClient:
 
         logger.info(
             "Sending chat request to DeepSeek",
-            message_count=len(prepared_messages),
+            message_count=len(prepared_messages) + bool(system_prompt),
             has_tools=bool(tools),
             stream=stream,
             payload=payload,
         )
 
+        body = self._encode_payload(payload, system_prompt)
+
+        if self._cache is None:
+            async for chunk in self._send(body, payload, stream):
+                yield chunk
+            return
+
+        key = hashlib.sha256(body).digest()
+        cached = self._cache.get(key)
+        if cached is not None:
+            logger.info("Serving chat response from cache")
+            for chunk in cached:
+                yield chunk
+            return
+
+        # Only responses that complete without error are cached
+        chunks: List[Dict[str, Any]] = []
+        async for chunk in self._send(body, payload, stream):
+            chunks.append(chunk)
+            yield chunk
+        self._cache.set(key, chunks)
+
+    async def _send(
+        self,
+        body: bytes,
+        payload: Dict[str, Any],
+        stream: bool,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Send an encoded chat request to DeepSeek.
+
+        Args:
+            body: Encoded request body
+            payload: Request payload, for error logging
+            stream: Whether to stream the response
+
+        Yields:
+            Response chunks (for streaming) or complete response
+
+        Raises:
+            DeepSeekError: If API request fails
+        """
+        if stream and settings.DEEPSEEK_HTTP_BACKEND == "aiohttp":
+            async for chunk in self._stream_aiohttp(body, payload):
+                yield chunk
+            return
+
         try:
-            async with httpx.AsyncClient() as client:
-                if stream:
-                    # Streaming mode
-                    async with client.stream(
-                        "POST",
-                        self.api_url,
-                        headers=self.headers,
-                        json=payload,
-                        timeout=120.0,
-                    ) as response:
-                        # Check for errors before streaming
-                        if response.status_code >= 400:
-                            # Try to read error body while stream is still open
-                            try:
-                                error_body = await response.aread()
-                                error_detail = error_body.decode()
-                                error_msg = f"DeepSeek API error: {response.status_code} - {error_detail}"
-                                logger.error(
-                                    "DeepSeek API error details",
-                                    status_code=response.status_code,
-                                    error_body=error_detail,
-                                    request_payload=payload,
-                                )
-                            except Exception:
-                                error_msg = f"DeepSeek API error: {response.status_code}"
-                                logger.error(
-                                    "DeepSeek API error",
-                                    status_code=response.status_code,
-                                    request_payload=payload,
-                                )
-                            raise DeepSeekError(error_msg)
-
-                        # Stream response chunks
-                        async for chunk in self._parse_stream(response):
-                            yield chunk
-                else:
-                    # Non-streaming mode
-                    response = await client.post(
-                        self.api_url,
-                        headers=self.headers,
-                        json=payload,
-                        timeout=120.0,
-                    )
-                    response.raise_for_status()
-                    data = response.json()
-                    yield data
+            client = self._get_http()
+            if stream:
+                # Streaming mode
+                async with client.stream(
+                    "POST",
+                    self.api_url,
+                    content=body,
+                ) as response:
+                    # Check for errors before streaming
+                    if response.status_code >= 400:
+                        # Try to read error body while stream is still open
+                        try:
+                            error_body = await response.aread()
+                            error_detail = error_body.decode()
+                            error_msg = (
+                                f"DeepSeek API error: {response.status_code} - {error_detail}"
+                            )
+                            logger.error(
+                                "DeepSeek API error details",
+                                status_code=response.status_code,
+                                error_body=error_detail,
+                                request_payload=payload,
+                            )
+                        except Exception:
+                            error_msg = f"DeepSeek API error: {response.status_code}"
+                            logger.error(
+                                "DeepSeek API error",
+                                status_code=response.status_code,
+                                request_payload=payload,
+                            )
+                        raise DeepSeekError(error_msg)
+
+                    # Stream response chunks
+                    async for chunk in self._parse_stream(response):
+                        yield chunk
+            else:
+                # Non-streaming mode
+                response = await client.post(self.api_url, content=body)
+                response.raise_for_status()
+                data = orjson.loads(response.content)
+                yield data
 
         except httpx.HTTPStatusError as e:
             error_msg = f"DeepSeek API error: {e.response.status_code}"
@@ -166,39 +299,140 @@ class DeepSeekClient:
             logger.error(error_msg)
             raise DeepSeekError(error_msg) from e
 
+    async def _stream_aiohttp(
+        self,
+        body: bytes,
+        payload: Dict[str, Any],
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream a chat completion over the shared aiohttp session.
+
+        Args:
+            body: Encoded request body
+            payload: Request payload, for error logging
+
+        Yields:
+            Parsed response chunks
+
+        Raises:
+            DeepSeekError: If API request fails
+        """
+        import aiohttp
+
+        try:
+            async with self._get_session().post(self.api_url, data=body) as response:
+                if response.status >= 400:
+                    error_detail = await response.text()
+                    logger.error(
+                        "DeepSeek API error details",
+                        status_code=response.status,
+                        error_body=error_detail,
+                        request_payload=payload,
+                    )
+                    raise DeepSeekError(
+                        f"DeepSeek API error: {response.status} - {error_detail}"
+                    )
+
+                lines = _split_lines(response.content.iter_any())
+                async for chunk in self._parse_lines(lines):
+                    yield chunk
+
+        except aiohttp.ClientError as e:
+            error_msg = f"DeepSeek request error: {str(e)}"
+            logger.error(error_msg)
+            raise DeepSeekError(error_msg) from e
+
+    def _encode_once(self, value: Any, build: Any) -> bytes:
+        """Encode a long-lived payload part, reusing the bytes while it is unchanged.
+
+        Args:
+            value: Object the encoding is cached for (by identity)
+            build: JSON-serializable value to encode on a cache miss
+
+        Returns:
+            Encoded JSON
+        """
+        cached = self._encoded.get(id(value))
+        if cached is not None and cached[0] is value:
+            return cached[1]
+
+        if len(self._encoded) >= 8:
+            self._encoded.clear()
+        encoded = orjson.dumps(build)
+        self._encoded[id(value)] = (value, encoded)
+        return encoded
+
+    def _encode_payload(
+        self,
+        payload: Dict[str, Any],
+        system_prompt: Optional[str] = None,
+    ) -> bytes:
+        """Encode the request body.
+
+        The system prompt and tool definitions are the same objects on every
+        request and ReAct iteration, so their JSON is encoded once and
+        spliced in; only the other fields and the history are encoded per call.
+
+        DeepSeek caches matching request prefixes automatically (no marker is
+        needed), so the prefix must stay byte-identical across requests: the
+        system prompt carries no per-request data and is the first message,
+        ahead of the history. Tools are encoded after the messages, in a
+        canonical order, so their bytes also repeat exactly.
+
+        Args:
+            payload: Request payload without the system message
+            system_prompt: Optional system prompt to prepend to the messages
+
+        Returns:
+            JSON request body
+        """
+        messages = orjson.dumps(payload["messages"])
+        if system_prompt:
+            system = self._encode_once(
+                system_prompt, {"role": "system", "content": system_prompt}
+            )
+            rest = b"]" if messages == b"[]" else b"," + messages[1:]
+            messages = b"[" + system + rest
+
+        parts = [
+            orjson.dumps({k: v for k, v in payload.items() if k not in ("messages", "tools")})[:-1],
+            b',"messages":',
+            messages,
+        ]
+        tools = payload.get("tools")
+        if tools:
+            parts += [b',"tools":', self._encode_once(tools, tools)]
+        parts.append(b"}")
+
+        return b"".join(parts)
+
     def _prepare_messages(
         self,
         messages: List[Dict[str, Any]],
-        system_prompt: Optional[str] = None,
     ) -> List[Dict[str, Any]]:
-        """Prepare messages with system prompt and sanitization.
+        """Prepare messages with sanitization.
+
+        The system prompt is not added here; ``_encode_payload`` splices it
+        into the encoded body.
 
         Args:
             messages: Original messages
-            system_prompt: Optional system prompt to prepend
 
         Returns:
             Prepared messages
         """
         result = []
 
-        # Add system prompt if provided
-        if system_prompt:
-            result.append({
-                "role": "system",
-                "content": system_prompt,
-            })
-
-        # Process and sanitize messages
+        # Process and sanitize messages; the caller's dicts are never modified,
+        # a message that needs a change is copied
         for msg in messages:
             # DeepSeek API requirement: reasoning_content only when tool_calls present
             if msg.get("role") == "assistant" and msg.get("tool_calls"):
                 # Must include reasoning_content (even if empty)
                 if not msg.get("reasoning_content"):
-                    msg["reasoning_content"] = ""
-            else:
+                    msg = {**msg, "reasoning_content": ""}
+            elif "reasoning_content" in msg:
                 # Remove reasoning_content when no tool_calls
-                msg.pop("reasoning_content", None)
+                msg = {k: v for k, v in msg.items() if k != "reasoning_content"}
 
             result.append(msg)
 
@@ -216,18 +450,41 @@ class DeepSeekClient:
         Yields:
             Parsed response chunks
         """
-        buffer = ""
+        async for chunk in self._parse_lines(_split_lines(response.aiter_bytes())):
+            yield chunk
 
-        async for line in response.aiter_lines():
-            if line.startswith("data: "):
+    async def _parse_lines(
+        self,
+        lines: AsyncIterator[bytes],
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Parse server-sent event lines from DeepSeek.
+
+        Args:
+            lines: Response body lines without line endings
+
+        Yields:
+            Parsed response chunks
+        """
+        async for line in lines:
+            if line.startswith(b"data: "):
                 data = line[6:]
 
-                if data == "[DONE]":
+                if data == b"[DONE]":
                     break
 
                 try:
-                    chunk = json.loads(data)
-                    yield chunk
-                except json.JSONDecodeError:
-                    logger.warning(f"Failed to parse stream chunk: {data}")
+                    chunk = orjson.loads(data)
+                except orjson.JSONDecodeError:
+                    logger.warning("Failed to parse stream chunk: %s", data)
                     continue
+
+                # The final chunk reports how much of the prompt hit the prefix cache
+                usage = chunk.get("usage")
+                if usage:
+                    logger.info(
+                        "DeepSeek usage",
+                        prompt_cache_hit_tokens=usage.get("prompt_cache_hit_tokens"),
+                        prompt_cache_miss_tokens=usage.get("prompt_cache_miss_tokens"),
+                        completion_tokens=usage.get("completion_tokens"),
+                    )
+                yield chunk
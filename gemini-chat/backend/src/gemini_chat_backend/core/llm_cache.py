@@ -0,0 +1,66 @@
+"""In-memory cache of DeepSeek responses for exact-match requests."""
+
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+
+class LLMCache:
+    """LRU cache of completed responses with a time-to-live.
+
+    Entries are keyed by a digest of the encoded request body, so only
+    byte-identical requests (same model, messages, tools and limits) hit.
+    Values are the chunks the request yielded, replayed in order on a hit.
+
+    Attributes:
+        ttl: Seconds an entry stays valid
+        max_entries: Entries kept before the least recently used is evicted
+    """
+
+    def __init__(self, ttl: float, max_entries: int = 256):
+        """Initialize cache.
+
+        Args:
+            ttl: Seconds an entry stays valid
+            max_entries: Maximum number of cached responses
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[bytes, Tuple[float, List[Dict[str, Any]]]]" = OrderedDict()
+
+    def get(self, key: bytes) -> Optional[List[Dict[str, Any]]]:
+        """Get cached chunks for a request.
+
+        Args:
+            key: Request digest
+
+        Returns:
+            Cached chunks, or None on a miss or expired entry
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, chunks = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return chunks
+
+    def set(self, key: bytes, chunks: List[Dict[str, Any]]) -> None:
+        """Cache the chunks of a completed request.
+
+        Args:
+            key: Request digest
+            chunks: Chunks yielded for the request
+        """
+        self._entries[key] = (time.monotonic() + self.ttl, chunks)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all cached responses."""
+        self._entries.clear()
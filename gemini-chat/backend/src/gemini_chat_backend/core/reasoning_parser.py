@@ -6,42 +6,63 @@ This module provides utilities to extract titles from reasoning content.
 import re
 from typing import List, Optional
 
+# Title patterns, matched against the first line of the reasoning
+_TITLE_PATTERNS = [
+    # Numbered items: "1. Analyze the problem" -> "Analyze the problem"
+    re.compile(r"^\d+[.):]\s*(.+?)(?:\.|$)", re.IGNORECASE),
+    # Transition words followed by content
+    re.compile(r"^(?:First|Second|Third|Fourth|Fifth),?\s*(.+?)(?:\.|$)", re.IGNORECASE),
+    # Action-oriented starters
+    re.compile(
+        r"^(?:Let me|I need to|I should|I'll|I will|Now I|Next I)\s+(.+?)(?:\.|$)",
+        re.IGNORECASE,
+    ),
+    # Analysis starters
+    re.compile(
+        r"^(?:Analyzing|Examining|Considering|Evaluating|Looking at|Reviewing)\s+(.+?)(?:\.|$)",
+        re.IGNORECASE,
+    ),
+]
+
+_SENTENCE_END = re.compile(r"[.!?]")
+
+# Keywords that typically indicate a new reasoning step, as one alternation
+# so each line is scanned once
+_STEP_INDICATOR = re.compile(
+    r"^\d+[.):]\s"  # "1. ", "2) ", "3: "
+    r"|^\s*[-•]\s"  # "- ", "• "
+    r"|^(?:first|second|third|fourth|fifth|finally|next|then|lastly|alternatively|moreover"
+    r"|furthermore|therefore|thus|consequently|as\s+a\s+result)\b",
+    re.IGNORECASE,
+)
+
 
 def extract_thought_title(reasoning: str) -> Optional[str]:
     """Extract a concise title from reasoning content.
 
+    Only the first line and first sentence are split out, so repeated calls
+    on a growing, streaming thought stay cheap.
+
     Args:
         reasoning: Cleaned reasoning content
 
     Returns:
         Optional title string, or None if no good title can be extracted
     """
-    if not reasoning or not reasoning.strip():
+    if not reasoning or reasoning.isspace():
         return None
 
-    # Common reasoning step patterns
-    patterns = [
-        # Numbered items: "1. Analyze the problem" -> "Analyze the problem"
-        (r"^\d+[.):]\s*(.+?)(?:\.|$)", re.IGNORECASE),
-        # Transition words followed by content
-        (r"^(?:First|Second|Third|Fourth|Fifth),?\s*(.+?)(?:\.|$)", re.IGNORECASE),
-        # Action-oriented starters
-        (r"^(?:Let me|I need to|I should|I'll|I will|Now I|Next I)\s+(.+?)(?:\.|$)", re.IGNORECASE),
-        # Analysis starters
-        (r"^(?:Analyzing|Examining|Considering|Evaluating|Looking at|Reviewing)\s+(.+?)(?:\.|$)", re.IGNORECASE),
-    ]
-
-    first_line = reasoning.strip().split("\n")[0]
-
-    for pattern, flags in patterns:
-        match = re.search(pattern, first_line, flags=flags)
+    first_line = reasoning.strip().split("\n", 1)[0]
+
+    for pattern in _TITLE_PATTERNS:
+        match = pattern.search(first_line)
         if match and match.group(1):
             extracted = match.group(1).strip()
             if 5 < len(extracted) < 80:
                 return _capitalize_first(extracted)
 
     # Fallback: Use first sentence or first N characters
-    first_sentence = re.split(r"[.!?]", reasoning)[0].strip()
+    first_sentence = _SENTENCE_END.split(reasoning, maxsplit=1)[0].strip()
     if 10 < len(first_sentence) < 60:
         return _capitalize_first(first_sentence)
 
@@ -64,51 +85,42 @@ def parse_reasoning_into_segments(reasoning: str) -> List[str]:
     Returns:
         List of reasoning segments
     """
-    if not reasoning or len(reasoning.strip()) == 0:
+    if not reasoning or reasoning.isspace():
         return []
 
     segments: List[str] = []
     lines = reasoning.split("\n")
-    current_segment = ""
-
-    # Keywords that typically indicate a new step
-    step_indicators = [
-        re.compile(r"^\d+[.):]\s", re.IGNORECASE),  # "1. ", "2) ", "3: "
-        re.compile(r"^\s*[-•]\s"),  # "- ", "• "
-        re.compile(
-            r"^(first|second|third|fourth|fifth|finally|next|then|lastly|alternatively|moreover|furthermore|therefore|thus|consequently|as\s+a\s+result)\b",
-            re.IGNORECASE,
-        ),
-    ]
+    # Lines of the current segment (each non-blank), and the length of their
+    # space-joined text, so a segment is joined once instead of grown per line
+    current_lines: List[str] = []
+    current_len = 0
 
     for line in lines:
         stripped = line.strip()
 
         if stripped == "":
             # Empty line - save current segment if substantial
-            if len(current_segment.strip()) > 20:
-                segments.append(current_segment.strip())
-                current_segment = ""
+            if current_len > 20:
+                segment = " ".join(current_lines).strip()
+                if len(segment) > 20:
+                    segments.append(segment)
+                    current_lines, current_len = [], 0
             continue
 
         # Check if this line starts a new step
-        is_new_step = any(pattern.search(stripped) for pattern in step_indicators)
+        is_new_step = _STEP_INDICATOR.search(stripped) is not None
 
-        if is_new_step and len(current_segment.strip()) > 0:
+        if is_new_step and current_lines:
             # Save current segment and start new one
-            segments.append(current_segment.strip())
-            current_segment = line
+            segments.append(" ".join(current_lines).strip())
+            current_lines, current_len = [line], len(line)
         else:
             # Continue current segment
-            separator = " " if current_segment else ""
-            current_segment += separator + line
+            current_len += len(line) + bool(current_lines)
+            current_lines.append(line)
 
     # Don't forget the last segment
-    if len(current_segment.strip()) > 0:
-        segments.append(current_segment.strip())
-
-    # If we ended up with no segments, treat entire text as one
-    if len(segments) == 0 and len(reasoning.strip()) > 0:
-        segments.append(reasoning.strip())
+    if current_lines:
+        segments.append(" ".join(current_lines).strip())
 
     return segments
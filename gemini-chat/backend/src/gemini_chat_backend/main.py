@@ -8,7 +8,9 @@ from fastapi.middleware.cors import CORSMiddleware
 
 from gemini_chat_backend.api.routes import setup_routes
 from gemini_chat_backend.config import settings
+from gemini_chat_backend.core.deepseek import DeepSeekClient
 from gemini_chat_backend.tools import register_tools
+from gemini_chat_backend.tools.exec import close_spare_interpreters
 from gemini_chat_backend.utils.logging import configure_logging, get_logger
 
 # Configure logging on module load
@@ -33,13 +35,29 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         version="0.1.0",
     )
 
+    # The aiohttp transport is an optional extra; fail here rather than on
+    # every streamed request
+    if settings.DEEPSEEK_HTTP_BACKEND == "aiohttp":
+        try:
+            import aiohttp  # noqa: F401
+        except ImportError as e:
+            raise RuntimeError(
+                "DEEPSEEK_HTTP_BACKEND=aiohttp requires aiohttp; "
+                "install gemini-chat-backend[aiohttp]"
+            ) from e
+
     # Register tools
     register_tools()
 
+    # Share one DeepSeek client (and its connection pool) across requests
+    app.state.deepseek = DeepSeekClient()
+
     yield
 
     # Shutdown
     logger.info("Application shutting down")
+    await app.state.deepseek.aclose()
+    await close_spare_interpreters()
 
 
 def create_app() -> FastAPI:
@@ -97,7 +115,10 @@ def main() -> None:
         "gemini_chat_backend.main:app",
         host=settings.HOST,
         port=settings.PORT,
-        reload=True,
+        # The reloader watches files from a supervisor process and cannot
+        # run multiple workers, so it is only used for development
+        reload=settings.DEBUG,
+        workers=1 if settings.DEBUG else settings.WORKERS,
         log_level=settings.LOG_LEVEL.lower(),
     )
 
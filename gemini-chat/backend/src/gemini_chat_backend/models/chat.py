@@ -35,18 +35,21 @@ class ChatRequest(BaseModel):
         messages: List of chat messages
         stream: Whether to stream the response
         max_tokens: Maximum tokens to generate
+        include_reasoning: Whether to stream reasoning and thought steps
     """
 
     messages: List[Message]
     stream: bool = True
     max_tokens: Optional[int] = None
+    include_reasoning: bool = True
 
 
 class StreamEvent(BaseModel):
     """Server-sent event for streaming responses.
 
     Attributes:
-        type: Event type (reasoning, content, tool_call, tool_result, tool_error, react_step, done, error)
+        type: Event type (reasoning, content, tool_call, tool_result, tool_error, react_step,
+            react_step_delta, done, error)
         data: Event data
     """
 
@@ -57,6 +60,7 @@ class StreamEvent(BaseModel):
         "tool_result",
         "tool_error",
         "react_step",
+        "react_step_delta",
         "done",
         "error",
     ]
@@ -1,8 +1,9 @@
 """Tool-related Pydantic models."""
 
-from typing import Any, Callable, Coroutine, Dict, List, Optional, Union
+import inspect
+from typing import Any, Callable, Dict, List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
 
 class ToolParameter(BaseModel):
@@ -34,12 +35,20 @@ class ToolDefinition(BaseModel):
     description: str
     parameters: List[ToolParameter]
 
+    _openai_format: Optional[Dict[str, Any]] = PrivateAttr(default=None)
+
     def to_openai_format(self) -> Dict[str, Any]:
         """Convert to OpenAI function calling format.
 
+        Definitions are not modified after construction, so the result is
+        built on first use and the same dict is returned afterwards.
+
         Returns:
             OpenAI function definition
         """
+        if self._openai_format is not None:
+            return self._openai_format
+
         properties = {}
         required = []
 
@@ -51,7 +60,7 @@ class ToolDefinition(BaseModel):
             if param.required:
                 required.append(param.name)
 
-        return {
+        self._openai_format = {
             "type": "function",
             "function": {
                 "name": self.name,
@@ -63,6 +72,7 @@ class ToolDefinition(BaseModel):
                 },
             },
         }
+        return self._openai_format
 
 
 class ToolCall(BaseModel):
@@ -107,6 +117,11 @@ class Tool:
         handler: Tool execution handler
     """
 
+    __slots__ = (
+        "name", "description", "parameters", "handler",
+        "_required_names", "_handler_is_async", "_definition",
+    )
+
     def __init__(
         self,
         name: str,
@@ -118,6 +133,13 @@ class Tool:
         self.description = description
         self.parameters = parameters
         self.handler = handler
+        # Checked on every call, so resolved once here
+        self._required_names = tuple(param.name for param in parameters if param.required)
+        self._handler_is_async = inspect.iscoroutinefunction(handler)
+        # Fields are already validated ToolParameters, so skip re-validation
+        self._definition = ToolDefinition.model_construct(
+            name=name, description=description, parameters=list(parameters)
+        )
 
     async def execute(self, **kwargs) -> Any:
         """Execute the tool with given parameters.
@@ -132,25 +154,22 @@ class Tool:
             ValueError: If required parameters are missing
         """
         # Validate parameters
-        for param in self.parameters:
-            if param.required and param.name not in kwargs:
-                raise ValueError(f"Required parameter '{param.name}' missing")
+        for name in self._required_names:
+            if name not in kwargs:
+                raise ValueError(f"Required parameter '{name}' missing")
 
         # Call handler
-        import inspect
-
-        if inspect.iscoroutinefunction(self.handler):
+        if self._handler_is_async:
             return await self.handler(**kwargs)
         return self.handler(**kwargs)
 
     def to_definition(self) -> ToolDefinition:
         """Get tool definition for API schema.
 
+        Built once at construction, so the same instance is returned on
+        every call.
+
         Returns:
             Tool definition
         """
-        return ToolDefinition(
-            name=self.name,
-            description=self.description,
-            parameters=self.parameters,
-        )
+        return self._definition
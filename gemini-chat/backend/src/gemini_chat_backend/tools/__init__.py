@@ -1,5 +1,7 @@
 """Tool modules for Gemini Chat Backend."""
 
+from typing import List
+
 from gemini_chat_backend.tools.base import BaseTool, ToolResult
 from gemini_chat_backend.tools.exec import JSExecTool, PythonExecTool
 from gemini_chat_backend.tools.file import FileReadTool, FileWriteTool
@@ -18,17 +20,17 @@ def register_tools() -> None:
     registry = get_tool_registry()
 
     # Always register read tools
-    registry.register(FileReadTool())
+    tools: List[BaseTool] = [FileReadTool()]
 
     # Conditionally register write/execution tools
     if not settings.TOOL_READ_ONLY_MODE:
-        registry.register(FileWriteTool())
-        registry.register(PythonExecTool())
-        registry.register(JSExecTool())
+        tools += [FileWriteTool(), PythonExecTool(), JSExecTool()]
     else:
         logger.info("Read-only mode enabled: write/execution tools are disabled")
 
-    logger.info(f"Registered {len(registry)} tools: {[t.name for t in registry.list_tools()]}")
+    registry.register_many(tools)
+
+    logger.info("Registered %d tools: %s", len(registry), [t.name for t in registry.list_tools()])
 
 
 __all__ = [
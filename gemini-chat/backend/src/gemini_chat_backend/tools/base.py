@@ -3,7 +3,7 @@
 from abc import ABC, abstractmethod
 from typing import Any, Dict, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel
 
 
 class ToolResult(BaseModel):
@@ -32,8 +32,11 @@ class BaseTool(ABC):
         name: Tool name
         description: Tool description
         parameters: JSON schema for tool parameters
+        parallel_safe: Whether calls may run concurrently with other tool calls
     """
 
+    parallel_safe: bool = False
+
     def __init__(
         self,
         name: str,
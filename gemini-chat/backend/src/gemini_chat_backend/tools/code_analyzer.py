@@ -3,7 +3,9 @@ Code analysis utilities for detecting modification operations.
 """
 import ast
 import re
-from typing import List, Tuple, Optional
+from collections import deque
+from functools import lru_cache
+from typing import Dict, Iterator, List, Tuple, Optional
 
 # Try to import logger, but fall back to a simple logger if dependencies not available
 try:
@@ -14,6 +16,40 @@ except ImportError:
     logging.basicConfig(level=logging.INFO)
     logger = logging.getLogger(__name__)
 
+# Fixed JavaScript checks, matched against lowercased code
+_JS_EVAL_CALL = re.compile(r'\beval\s*\(')
+_JS_FUNCTION_CONSTRUCTOR = re.compile(r'\bnew\s+Function\s*\(')
+_JS_FS_WRITE = re.compile(r'\bfs\.(write|append|unlink|rmdir|mkdir|rename|chmod|chown)')
+
+# Python AST nodes the analyzer acts on
+_PYTHON_RELEVANT_NODES = frozenset({ast.Import, ast.ImportFrom, ast.Call, ast.Assign})
+# Python AST nodes that cannot contain relevant nodes, so are never descended into
+_PYTHON_LEAF_NODES = (
+    ast.Constant, ast.Name, ast.arg, ast.alias,
+    ast.expr_context, ast.operator, ast.unaryop, ast.cmpop, ast.boolop,
+)
+
+
+def _iter_relevant_nodes(tree: ast.AST) -> Iterator[ast.AST]:
+    """Yield import, call and assignment nodes in ``ast.walk`` order.
+
+    Like ``ast.walk`` this is breadth-first, but leaf nodes are not queued.
+
+    Args:
+        tree: Parsed module
+
+    Yields:
+        Relevant AST nodes
+    """
+    queue = deque([tree])
+    while queue:
+        node = queue.popleft()
+        if type(node) in _PYTHON_RELEVANT_NODES:
+            yield node
+        for child in ast.iter_child_nodes(node):
+            if not isinstance(child, _PYTHON_LEAF_NODES):
+                queue.append(child)
+
 
 class CodeAnalyzer:
     """Analyzes code for modification operations."""
@@ -25,6 +61,10 @@ class CodeAnalyzer:
             'mkdir', 'makedirs', 'chmod', 'chown',
             'exec', 'eval', 'compile', 'system', 'popen',
         ]
+        # Lowercased once for case-insensitive lookups while walking the AST
+        self._python_modification_keywords_lower = frozenset(
+            keyword.lower() for keyword in self.python_modification_keywords
+        )
 
         # Define safe vs dangerous functions for restricted modules
         # Start with minimal safe set - can be expanded based on user feedback
@@ -67,8 +107,15 @@ class CodeAnalyzer:
             }
         }
 
-        # For modules imported with aliases (e.g., import os as operating_system)
-        self.module_aliases = {}
+        # Every Python detection needs one of these in the source: a keyword
+        # call, a restricted module (named in its import or use), or a dunder
+        # assignment. Matched against lowercased code, since keyword calls are
+        # case-insensitive.
+        self._python_required_tokens = re.compile('|'.join(
+            re.escape(token) for token in sorted(
+                self._python_modification_keywords_lower | set(self.restricted_modules) | {'__'}
+            )
+        ))
 
         # JavaScript modification patterns
         self.js_modification_keywords = [
@@ -79,6 +126,16 @@ class CodeAnalyzer:
             'child_process', 'process.exit'
         ]
 
+        # Compiled once per analyzer: a word-bounded pattern per keyword, and
+        # their union so code without any keyword is cleared in one scan
+        self._js_keyword_patterns = [
+            (keyword, re.compile(rf'\b{keyword.lower()}\b'))
+            for keyword in self.js_modification_keywords
+        ]
+        self._js_any_keyword = re.compile(
+            '|'.join(pattern.pattern for _, pattern in self._js_keyword_patterns)
+        )
+
     def analyze_python_code(self, code: str) -> Tuple[bool, Optional[str], List[str]]:
         """Analyze Python code for modification operations.
 
@@ -88,19 +145,36 @@ class CodeAnalyzer:
         Returns:
             Tuple of (is_safe, error_message, detected_operations)
         """
+        # Nothing to parse; isspace() avoids copying the code like strip() would
+        if not code or code.isspace():
+            return True, None, []
+        # Nothing the analysis could flag, so skip parsing. Non-ASCII code is
+        # always parsed, as the parser NFKC-normalizes identifiers.
+        if code.isascii() and not self._python_required_tokens.search(code.lower()):
+            return True, None, []
+
         try:
             tree = ast.parse(code)
             detected_ops = []
-            self.module_aliases = {}  # Reset for each analysis
-
-            # First pass: collect imports and their aliases
-            for node in ast.walk(tree):
-                if isinstance(node, ast.Import):
+            # Modules imported with aliases (e.g., import os as operating_system).
+            # Local to each analysis and passed to the checks, so the analyzer
+            # holds no per-call state and can be shared.
+            module_aliases = {}
+
+            # Single walk: collect imports and their aliases, and keep the nodes
+            # to check. Checks run after the walk, since an alias may be
+            # imported after (or nested deeper than) its use.
+            nodes_to_check = []
+            for node in _iter_relevant_nodes(tree):
+                if isinstance(node, (ast.Call, ast.Assign)):
+                    nodes_to_check.append(node)
+
+                elif isinstance(node, ast.Import):
                     for alias in node.names:
                         module_name = alias.name
                         alias_name = alias.asname or module_name
                         # Store mapping from alias to actual module
-                        self.module_aliases[alias_name] = module_name
+                        module_aliases[alias_name] = module_name
 
                 elif isinstance(node, ast.ImportFrom):
                     # Handle 'from module import name'
@@ -109,22 +183,22 @@ class CodeAnalyzer:
                         imported_name = alias.name
                         alias_name = alias.asname or imported_name
                         # Store as module.function for later analysis
-                        self.module_aliases[alias_name] = f"{module_name}.{imported_name}"
+                        module_aliases[alias_name] = f"{module_name}.{imported_name}"
 
-            # Second pass: analyze function calls and operations
-            for node in ast.walk(tree):
+            # Analyze function calls and operations
+            for node in nodes_to_check:
                 # Check for calls to dangerous functions
                 if isinstance(node, ast.Call):
                     if isinstance(node.func, ast.Name):
                         func_name = node.func.id
                         # Check if this is a direct call to a dangerous function
-                        if func_name.lower() in [kw.lower() for kw in self.python_modification_keywords]:
+                        if func_name.lower() in self._python_modification_keywords_lower:
                             detected_ops.append(f"call to {func_name}")
 
                     elif isinstance(node.func, ast.Attribute):
                         # Handle calls like os.getcwd(), sys.version, etc.
                         attr_chain = self._extract_attribute_chain(node.func)
-                        result = self._check_attribute_call(attr_chain)
+                        result = self._check_attribute_call(attr_chain, module_aliases)
                         if result:
                             detected_ops.append(result)
 
@@ -140,11 +214,11 @@ class CodeAnalyzer:
             return True, None, []
 
         except SyntaxError as e:
-            logger.warning(f"Syntax error in Python code analysis: {e}")
+            logger.warning("Syntax error in Python code analysis: %s", e)
             # Allow syntax errors - they'll fail at execution anyway
             return True, None, []
         except Exception as e:
-            logger.error(f"Error analyzing Python code: {e}")
+            logger.error("Error analyzing Python code: %s", e)
             return False, f"Code analysis failed: {str(e)}", []
 
     def analyze_javascript_code(self, code: str) -> Tuple[bool, Optional[str], List[str]]:
@@ -156,28 +230,30 @@ class CodeAnalyzer:
         Returns:
             Tuple of (is_safe, error_message, detected_operations)
         """
+        if not code or code.isspace():
+            return True, None, []
+
         detected_ops = []
 
         # Convert to lowercase for case-insensitive matching
         code_lower = code.lower()
 
         # Check for dangerous patterns
-        for pattern in self.js_modification_keywords:
-            # Simple pattern matching - could be enhanced
-            if re.search(rf'\b{pattern.lower()}\b', code_lower):
-                detected_ops.append(pattern)
+        if self._js_any_keyword.search(code_lower):
+            for keyword, pattern in self._js_keyword_patterns:
+                # Simple pattern matching - could be enhanced
+                if pattern.search(code_lower):
+                    detected_ops.append(keyword)
 
         # Check for eval and Function constructors
-        if re.search(r'\beval\s*\(', code_lower):
+        if _JS_EVAL_CALL.search(code_lower):
             detected_ops.append('eval')
-        if re.search(r'\bnew\s+Function\s*\(', code_lower):
+        if _JS_FUNCTION_CONSTRUCTOR.search(code_lower):
             detected_ops.append('Function constructor')
 
-        # Check for file system operations
-        if re.search(r'\bfs\.\w+', code_lower):
-            # Check if it's a write operation
-            if re.search(r'\bfs\.(write|append|unlink|rmdir|mkdir|rename|chmod|chown)', code_lower):
-                detected_ops.append('fs operation')
+        # Check for file system write operations
+        if _JS_FS_WRITE.search(code_lower):
+            detected_ops.append('fs operation')
 
         if detected_ops:
             return False, f"Code contains modification operations: {', '.join(detected_ops)}", detected_ops
@@ -189,20 +265,25 @@ class CodeAnalyzer:
         chain = []
         current = node
 
+        # Collected innermost-last, then reversed once
         while isinstance(current, ast.Attribute):
-            chain.insert(0, current.attr)
+            chain.append(current.attr)
             current = current.value
 
         if isinstance(current, ast.Name):
-            chain.insert(0, current.id)
+            chain.append(current.id)
 
+        chain.reverse()
         return chain
 
-    def _check_attribute_call(self, attr_chain: List[str]) -> Optional[str]:
+    def _check_attribute_call(
+        self, attr_chain: List[str], module_aliases: Dict[str, str]
+    ) -> Optional[str]:
         """Check if an attribute-based function call is safe.
 
         Args:
             attr_chain: List of attribute names (e.g., ['os', 'getcwd'])
+            module_aliases: Mapping of import aliases to modules
 
         Returns:
             Error message if dangerous, None if safe
@@ -212,7 +293,7 @@ class CodeAnalyzer:
 
         # Check if first element is a known module or alias
         module_name = attr_chain[0]
-        actual_module = self.module_aliases.get(module_name, module_name)
+        actual_module = module_aliases.get(module_name, module_name)
 
         # Split actual_module if it's in module.function format (from import)
         if '.' in actual_module:
@@ -266,3 +347,25 @@ class CodeAnalyzer:
             return safe, error
         else:
             return False, f"Unsupported language: {language}"
+
+
+# Shared by the exec tools; analyses keep no state on the instance
+_default_analyzer = CodeAnalyzer()
+
+
+# Agents often resubmit the same snippet, and the verdict depends only on the
+# code and language
+@lru_cache(maxsize=256)
+def is_code_safe(code: str, language: str = 'python') -> Tuple[bool, Optional[str]]:
+    """Check if code is safe to execute using the shared analyzer.
+
+    Results are cached, so repeated snippets are not parsed again.
+
+    Args:
+        code: Code to check
+        language: 'python' or 'javascript'
+
+    Returns:
+        Tuple of (is_safe, error_message)
+    """
+    return _default_analyzer.is_code_safe(code, language)
@@ -1,24 +1,220 @@
 """Code execution tools."""
 
 import asyncio
+import contextlib
 import sys
-from typing import Any
+from typing import Any, Dict, Optional, Tuple
 
 from gemini_chat_backend.tools.base import BaseTool, ToolResult
-from gemini_chat_backend.tools.code_analyzer import CodeAnalyzer
+from gemini_chat_backend.tools.code_analyzer import is_code_safe
 from gemini_chat_backend.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Run by a spare interpreter: read the code from stdin and run it like
+# ``python -c code`` would, in __main__ and without the bootstrap's own frame
+# in tracebacks. Binds no names, so the code sees a clean namespace.
+_PYTHON_BOOTSTRAP = (
+    "__import__('sys').excepthook = lambda t, v, tb: __import__('sys').__excepthook__("
+    "t, v.with_traceback(tb and tb.tb_next), tb and tb.tb_next)\n"
+    "exec(compile(__import__('sys').stdin.buffer.read().decode(), '<string>', 'exec'))"
+)
+
+# Output kept per stream; a process that writes more is killed, so a runaway
+# print loop cannot exhaust memory before the timeout
+_OUTPUT_LIMIT = 1_000_000
+_OUTPUT_LIMIT_ERROR = f"Output limit exceeded ({_OUTPUT_LIMIT / 1_000_000:g} MB)"
+
+# Interpreter commands; each reads a whole snippet from stdin and runs it
+_PYTHON_COMMAND: Tuple[str, ...] = (sys.executable, "-c", _PYTHON_BOOTSTRAP)
+_NODE_COMMAND: Tuple[str, ...] = ("node.exe" if sys.platform == "win32" else "node",)
+
+# One interpreter per command started ahead of time, so its startup overlaps
+# the wait for the next call. Each interpreter runs a single snippet and exits,
+# so no state carries over between calls. Processes belong to the loop that
+# started them.
+_spare_interpreters: Dict[
+    Tuple[str, ...], Tuple[asyncio.subprocess.Process, asyncio.AbstractEventLoop]
+] = {}
+
+
+async def _start_interpreter(command: Tuple[str, ...]) -> asyncio.subprocess.Process:
+    """Start an interpreter waiting for code on stdin.
+
+    Args:
+        command: Interpreter command line
+
+    Returns:
+        The started process
+    """
+    return await asyncio.create_subprocess_exec(
+        *command,
+        stdin=asyncio.subprocess.PIPE,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+
+
+async def _discard_interpreter(proc: asyncio.subprocess.Process) -> None:
+    """Stop an interpreter that will not run any code and reap it.
+
+    Args:
+        proc: Process started on the running loop
+    """
+    if proc.returncode is None:
+        proc.kill()
+    await proc.wait()
+
+
+def _kill_foreign_interpreter(proc: asyncio.subprocess.Process) -> None:
+    """Stop an interpreter started on another (possibly closed) loop.
+
+    Its exit is collected by asyncio's child watcher, as it cannot be awaited
+    from this loop.
+
+    Args:
+        proc: Process started on another loop
+    """
+    with contextlib.suppress(ProcessLookupError):  # Already exited
+        proc.kill()
+
+
+async def _take_interpreter(command: Tuple[str, ...]) -> asyncio.subprocess.Process:
+    """Take the spare interpreter for a command and start its replacement.
+
+    Args:
+        command: Interpreter command line
+
+    Returns:
+        A started interpreter waiting for code
+
+    Raises:
+        FileNotFoundError: If the interpreter executable is not found
+    """
+    loop = asyncio.get_running_loop()
+    proc: Optional[asyncio.subprocess.Process] = None
+    if command in _spare_interpreters:
+        proc, proc_loop = _spare_interpreters.pop(command)
+        if proc_loop is not loop:
+            _kill_foreign_interpreter(proc)
+            proc = None
+        elif proc.returncode is not None:
+            await proc.wait()
+            proc = None
+    if proc is None:
+        proc = await _start_interpreter(command)
+
+    try:
+        spare = await _start_interpreter(command)
+    except BaseException:
+        # Cancelled (or failed) before the caller got the process
+        await asyncio.shield(_discard_interpreter(proc))
+        raise
+    if command in _spare_interpreters:
+        # A concurrent call already left a spare
+        await _discard_interpreter(spare)
+    else:
+        _spare_interpreters[command] = (spare, loop)
+    return proc
+
+
+async def close_spare_interpreters() -> None:
+    """Stop and reap all pre-started interpreters.
+
+    Called on application shutdown; later calls start new spares as needed.
+    """
+    loop = asyncio.get_running_loop()
+    spares = list(_spare_interpreters.values())
+    _spare_interpreters.clear()
+    for proc, proc_loop in spares:
+        if proc_loop is loop:
+            await _discard_interpreter(proc)
+        else:
+            _kill_foreign_interpreter(proc)
+
+
+async def _read_capped(
+    proc: asyncio.subprocess.Process, stream: asyncio.StreamReader
+) -> Tuple[bytes, bool]:
+    """Read a process stream up to the output limit.
+
+    Args:
+        proc: Process owning the stream, killed if the limit is exceeded
+        stream: Stream to drain
+
+    Returns:
+        Tuple of (data, whether the limit was exceeded)
+    """
+    data = bytearray()
+    while chunk := await stream.read(65536):
+        data += chunk
+        if len(data) > _OUTPUT_LIMIT:
+            proc.kill()
+            return bytes(data[:_OUTPUT_LIMIT]), True
+    return bytes(data), False
+
+
+async def _communicate(
+    proc: asyncio.subprocess.Process, code: str, timeout: float
+) -> Optional[Tuple[bytes, bytes, bool]]:
+    """Send code to a process on stdin and collect bounded output.
+
+    The process is killed on timeout, when output exceeds the limit, and if
+    the caller is cancelled.
+
+    Args:
+        proc: Process reading code from stdin
+        code: Code to send
+        timeout: Seconds to wait for the process to finish
+
+    Returns:
+        Tuple of (stdout, stderr, whether output exceeded the limit), or None
+        on timeout
+    """
+
+    stdin, stdout, stderr = proc.stdin, proc.stdout, proc.stderr
+    # Interpreters are always started with all three streams piped
+    assert stdin is not None and stdout is not None and stderr is not None
+
+    async def feed() -> None:
+        stdin.write(code.encode("utf-8"))
+        # Exited without reading everything; its output says why
+        with contextlib.suppress(BrokenPipeError, ConnectionResetError):
+            await stdin.drain()
+        stdin.close()
+
+    try:
+        async with asyncio.timeout(timeout):
+            _, (out, out_over), (err, err_over) = await asyncio.gather(
+                feed(), _read_capped(proc, stdout), _read_capped(proc, stderr)
+            )
+            await proc.wait()
+        return out, err, out_over or err_over
+    except asyncio.TimeoutError:
+        return None
+    finally:
+        if proc.returncode is None:
+            proc.kill()
+            await proc.wait()
+
 
 class PythonExecTool(BaseTool):
     """Tool to execute Python code with read-only restrictions."""
 
-    def __init__(self) -> None:
-        """Initialize Python exec tool."""
+    parallel_safe = True
+
+    def __init__(self, timeout: float = 30.0) -> None:
+        """Initialize Python exec tool.
+
+        Args:
+            timeout: Seconds a snippet may run before it is killed
+        """
         super().__init__(
             name="python_exec",
-            description="Execute Python code (timeout: 30s, read-only mode). Use single quotes for strings inside code.",
+            description=(
+                f"Execute Python code (timeout: {timeout:g}s, read-only mode). "
+                "Use single quotes for strings inside code."
+            ),
             parameters={
                 "type": "object",
                 "properties": {
@@ -30,7 +226,7 @@ class PythonExecTool(BaseTool):
                 "required": ["code"],
             },
         )
-        self._analyzer = CodeAnalyzer()
+        self.timeout = timeout
 
     async def execute(self, **kwargs: Any) -> ToolResult:
         """Execute Python code with read-only checks."""
@@ -40,30 +236,20 @@ class PythonExecTool(BaseTool):
                 return ToolResult(success=False, error="Code is required")
 
             # Check if code is safe (read-only)
-            is_safe, error_msg = self._analyzer.is_code_safe(code, language='python')
+            is_safe, error_msg = is_code_safe(code, language='python')
             if not is_safe:
-                logger.warning(f"Blocked Python code execution: {error_msg}")
+                logger.warning("Blocked Python code execution: %s", error_msg)
                 return ToolResult(success=False, error=error_msg)
 
-            # Run Python code as subprocess - no need to escape quotes when passing as separate argument
-            proc = await asyncio.create_subprocess_exec(
-                sys.executable,
-                "-c",
-                code,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-            )
-
-            try:
-                # Wait with timeout
-                stdout_bytes, stderr_bytes = await asyncio.wait_for(
-                    proc.communicate(),
-                    timeout=30.0,
-                )
-            except asyncio.TimeoutError:
-                proc.kill()
-                await proc.wait()
-                return ToolResult(success=False, error="Execution timeout (30s)")
+            # Run Python code in an already started interpreter; the code goes
+            # over stdin, so no quote escaping is needed
+            proc = await _take_interpreter(_PYTHON_COMMAND)
+            output = await _communicate(proc, code, self.timeout)
+            if output is None:
+                return ToolResult(success=False, error=f"Execution timeout ({self.timeout:g}s)")
+            stdout_bytes, stderr_bytes, over_limit = output
+            if over_limit:
+                return ToolResult(success=False, error=_OUTPUT_LIMIT_ERROR)
 
             stdout = stdout_bytes.decode("utf-8", errors="replace")
             stderr = stderr_bytes.decode("utf-8", errors="replace")
@@ -72,18 +258,24 @@ class PythonExecTool(BaseTool):
             return ToolResult(success=True, result={"stdout": stdout, "stderr": stderr})
 
         except Exception as e:
-            logger.error(f"Error executing Python code: {e}")
+            logger.error("Error executing Python code: %s", e)
             return ToolResult(success=False, error=str(e))
 
 
 class JSExecTool(BaseTool):
     """Tool to execute JavaScript code with read-only restrictions."""
 
-    def __init__(self) -> None:
-        """Initialize JavaScript exec tool."""
+    parallel_safe = True
+
+    def __init__(self, timeout: float = 5.0) -> None:
+        """Initialize JavaScript exec tool.
+
+        Args:
+            timeout: Seconds a snippet may run before it is killed
+        """
         super().__init__(
             name="js_exec",
-            description="Execute JavaScript code (timeout: 5s, read-only mode)",
+            description=f"Execute JavaScript code (timeout: {timeout:g}s, read-only mode)",
             parameters={
                 "type": "object",
                 "properties": {
@@ -95,7 +287,7 @@ class JSExecTool(BaseTool):
                 "required": ["code"],
             },
         )
-        self._analyzer = CodeAnalyzer()
+        self.timeout = timeout
 
     async def execute(self, **kwargs: Any) -> ToolResult:
         """Execute JavaScript code with read-only checks."""
@@ -105,35 +297,21 @@ class JSExecTool(BaseTool):
                 return ToolResult(success=False, error="Code is required")
 
             # Check if code is safe (read-only)
-            is_safe, error_msg = self._analyzer.is_code_safe(code, language='javascript')
+            is_safe, error_msg = is_code_safe(code, language='javascript')
             if not is_safe:
-                logger.warning(f"Blocked JavaScript code execution: {error_msg}")
+                logger.warning("Blocked JavaScript code execution: %s", error_msg)
                 return ToolResult(success=False, error=error_msg)
 
-            # Try to find node executable
-            node_cmd = "node"
-            if sys.platform == "win32":
-                node_cmd = "node.exe"
-
-            # No need to escape quotes when passing arguments separately to subprocess
-            # Similar to PythonExecTool which passes code directly to python -c
-            proc = await asyncio.create_subprocess_exec(
-                node_cmd,
-                "-e",
-                code,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-            )
+            # Node runs a script read from stdin, so the code needs no escaping
+            # and is not subject to argument length limits
+            proc = await _take_interpreter(_NODE_COMMAND)
 
-            try:
-                stdout_bytes, stderr_bytes = await asyncio.wait_for(
-                    proc.communicate(),
-                    timeout=5.0,
-                )
-            except asyncio.TimeoutError:
-                proc.kill()
-                await proc.wait()
-                return ToolResult(success=False, error="Execution timeout (5s)")
+            output = await _communicate(proc, code, self.timeout)
+            if output is None:
+                return ToolResult(success=False, error=f"Execution timeout ({self.timeout:g}s)")
+            stdout_bytes, stderr_bytes, over_limit = output
+            if over_limit:
+                return ToolResult(success=False, error=_OUTPUT_LIMIT_ERROR)
 
             stdout = stdout_bytes.decode("utf-8", errors="replace")
             stderr = stderr_bytes.decode("utf-8", errors="replace")
@@ -147,5 +325,5 @@ class JSExecTool(BaseTool):
         except FileNotFoundError:
             return ToolResult(success=False, error="Node.js not found in PATH")
         except Exception as e:
-            logger.error(f"Error executing JavaScript code: {e}")
+            logger.error("Error executing JavaScript code: %s", e)
             return ToolResult(success=False, error=str(e))
@@ -1,6 +1,8 @@
 """File operations tools."""
 
+import asyncio
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -11,6 +13,23 @@ from gemini_chat_backend.utils.logging import get_logger
 logger = get_logger(__name__)
 
 
+@lru_cache(maxsize=4)
+def _working_dir(directory: str, cwd: str) -> Path:
+    """Resolve the tool working directory once per configured value and CWD.
+
+    A relative directory depends on the process CWD, so the CWD is part of
+    the cache key and a ``chdir`` never leaves a stale sandbox root.
+
+    Args:
+        directory: Configured working directory
+        cwd: Current process working directory
+
+    Returns:
+        Resolved absolute working directory
+    """
+    return (Path(cwd) / directory).resolve()
+
+
 def _resolve_safe_path(file_path: str) -> Path:
     """Resolve a path safely within the working directory.
 
@@ -23,10 +42,11 @@ def _resolve_safe_path(file_path: str) -> Path:
     Raises:
         ValueError: If path attempts to escape working directory
     """
-    working_dir = Path(settings.TOOL_WORKING_DIRECTORY).resolve()
+    working_dir = _working_dir(settings.TOOL_WORKING_DIRECTORY, os.getcwd())
     resolved = (working_dir / file_path).resolve()
 
-    if not str(resolved).startswith(str(working_dir)):
+    # Compared by path components, so a sibling like "<dir>2" is rejected
+    if not resolved.is_relative_to(working_dir):
         raise ValueError(f"Access denied: Path outside working directory: {file_path}")
 
     return resolved
@@ -35,6 +55,8 @@ def _resolve_safe_path(file_path: str) -> Path:
 class FileReadTool(BaseTool):
     """Tool to read a file from the filesystem."""
 
+    parallel_safe = True
+
     def __init__(self) -> None:
         """Initialize file read tool."""
         super().__init__(
@@ -66,22 +88,35 @@ class FileReadTool(BaseTool):
             if not file_path:
                 return ToolResult(success=False, error="Path is required")
 
-            full_path = _resolve_safe_path(file_path)
+            # Path resolution and the read are blocking, so run off the event loop
+            return await asyncio.to_thread(self._read, file_path)
+
+        except Exception as e:
+            logger.error("Error reading file: %s", e)
+            return ToolResult(success=False, error=str(e))
+
+    def _read(self, file_path: str) -> ToolResult:
+        """Read a file synchronously.
+
+        Args:
+            file_path: Path to the file (relative to working directory)
 
-            if not full_path.exists():
-                return ToolResult(success=False, error=f"File not found: {file_path}")
+        Returns:
+            Tool execution result with file content
+        """
+        full_path = _resolve_safe_path(file_path)
 
-            if not full_path.is_file():
-                return ToolResult(success=False, error=f"Not a file: {file_path}")
+        if not full_path.exists():
+            return ToolResult(success=False, error=f"File not found: {file_path}")
 
-            content = full_path.read_text(encoding="utf-8")
+        if not full_path.is_file():
+            return ToolResult(success=False, error=f"Not a file: {file_path}")
 
-            logger.info(f"File read successfully: {file_path}")
-            return ToolResult(success=True, result={"path": file_path, "content": content})
+        # Decoded like exec output, so non-UTF-8 bytes do not fail the read
+        content = full_path.read_bytes().decode("utf-8", errors="replace")
 
-        except Exception as e:
-            logger.error(f"Error reading file: {e}")
-            return ToolResult(success=False, error=str(e))
+        logger.info("File read successfully: %s", file_path)
+        return ToolResult(success=True, result={"path": file_path, "content": content})
 
 
 class FileWriteTool(BaseTool):
@@ -125,17 +160,30 @@ class FileWriteTool(BaseTool):
             if not file_path:
                 return ToolResult(success=False, error="Path is required")
 
-            full_path = _resolve_safe_path(file_path)
+            # Path resolution and the write are blocking, so run off the event loop
+            return await asyncio.to_thread(self._write, file_path, content)
 
-            # Create parent directories if needed
-            full_path.parent.mkdir(parents=True, exist_ok=True)
+        except Exception as e:
+            logger.error("Error writing file: %s", e)
+            return ToolResult(success=False, error=str(e))
 
-            # Write the file
-            full_path.write_text(content, encoding="utf-8")
+    def _write(self, file_path: str, content: str) -> ToolResult:
+        """Write a file synchronously.
 
-            logger.info(f"File written successfully: {file_path}")
-            return ToolResult(success=True, result={"path": file_path, "success": True})
+        Args:
+            file_path: Path to the file (relative to working directory)
+            content: Content to write
 
-        except Exception as e:
-            logger.error(f"Error writing file: {e}")
-            return ToolResult(success=False, error=str(e))
+        Returns:
+            Tool execution result
+        """
+        full_path = _resolve_safe_path(file_path)
+
+        # Create parent directories if needed
+        full_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Write the file
+        full_path.write_text(content, encoding="utf-8")
+
+        logger.info("File written successfully: %s", file_path)
+        return ToolResult(success=True, result={"path": file_path, "success": True})
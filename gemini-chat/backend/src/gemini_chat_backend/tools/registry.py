@@ -1,8 +1,8 @@
 """Tool registry for managing available tools."""
 
-from typing import Any, Dict, List, Optional, Type
+from typing import Any, Dict, Iterable, List, Optional
 
-from gemini_chat_backend.tools.base import BaseTool, ToolResult
+from gemini_chat_backend.tools.base import BaseTool
 from gemini_chat_backend.utils.logging import get_logger
 
 logger = get_logger(__name__)
@@ -14,6 +14,10 @@ class ToolRegistry:
     def __init__(self):
         """Initialize empty tool registry."""
         self._tools: Dict[str, BaseTool] = {}
+        # Bumped on every mutation so callers can cache derived data
+        self._version = 0
+        # Built on first use and dropped on every mutation
+        self._definitions_cache: Optional[List[Dict[str, Any]]] = None
         logger.info("Tool registry initialized")
 
     def register(self, tool: BaseTool) -> None:
@@ -29,7 +33,35 @@ class ToolRegistry:
             raise ValueError(f"Tool '{tool.name}' is already registered")
 
         self._tools[tool.name] = tool
-        logger.info(f"Tool registered: {tool.name}")
+        self._version += 1
+        self._definitions_cache = None
+        logger.info("Tool registered: %s", tool.name)
+
+    def register_many(self, tools: Iterable[BaseTool]) -> None:
+        """Register several tools at once.
+
+        All names are checked before any tool is added, so a duplicate
+        leaves the registry unchanged.
+
+        Args:
+            tools: Tool instances to register
+
+        Raises:
+            ValueError: If a tool name is already registered or repeated
+        """
+        new_tools: Dict[str, BaseTool] = {}
+        for tool in tools:
+            if tool.name in self._tools or tool.name in new_tools:
+                raise ValueError(f"Tool '{tool.name}' is already registered")
+            new_tools[tool.name] = tool
+
+        if not new_tools:
+            return
+
+        self._tools.update(new_tools)
+        self._version += 1
+        self._definitions_cache = None
+        logger.info("Tools registered: %s", ", ".join(new_tools))
 
     def unregister(self, name: str) -> None:
         """Unregister a tool.
@@ -44,7 +76,18 @@ class ToolRegistry:
             raise KeyError(f"Tool '{name}' not found")
 
         del self._tools[name]
-        logger.info(f"Tool unregistered: {name}")
+        self._version += 1
+        self._definitions_cache = None
+        logger.info("Tool unregistered: %s", name)
+
+    @property
+    def version(self) -> int:
+        """Get the registry version.
+
+        Returns:
+            Counter incremented whenever tools are registered, unregistered or cleared
+        """
+        return self._version
 
     def get(self, name: str) -> Optional[BaseTool]:
         """Get a tool by name.
@@ -68,14 +111,21 @@ class ToolRegistry:
     def get_definitions(self) -> List[Dict[str, Any]]:
         """Get tool definitions for OpenAI API.
 
+        The list is cached until the registry changes, so callers must not
+        modify it.
+
         Returns:
             List of tool definitions
         """
-        return [tool.get_definition() for tool in self._tools.values()]
+        if self._definitions_cache is None:
+            self._definitions_cache = [tool.get_definition() for tool in self._tools.values()]
+        return self._definitions_cache
 
     def clear(self) -> None:
         """Clear all registered tools."""
         self._tools.clear()
+        self._version += 1
+        self._definitions_cache = None
         logger.info("Tool registry cleared")
 
     def __contains__(self, name: str) -> bool:
@@ -98,23 +148,19 @@ class ToolRegistry:
         return len(self._tools)
 
 
-# Global registry instance
-_global_registry: Optional[ToolRegistry] = None
+# Global registry instance, created at import so it is never built twice
+_global_registry = ToolRegistry()
 
 
 def get_tool_registry() -> ToolRegistry:
     """Get global tool registry instance.
 
     Returns:
-        Global tool registry (creates if needed)
+        Global tool registry
     """
-    global _global_registry
-    if _global_registry is None:
-        _global_registry = ToolRegistry()
     return _global_registry
 
 
 def reset_tool_registry() -> None:
-    """Reset global tool registry."""
-    global _global_registry
-    _global_registry = None
+    """Reset global tool registry by removing all tools."""
+    _global_registry.clear()
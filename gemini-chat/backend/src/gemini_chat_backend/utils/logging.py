@@ -2,10 +2,23 @@
 
 import logging
 import sys
-from typing import Any, Dict, Optional
+from typing import Any, Optional
 
+import orjson
 import structlog
-from pythonjsonlogger import jsonlogger
+
+
+def _orjson_dumps(obj: Any, **kwargs: Any) -> str:
+    """Serialize a log event with orjson for structlog's JSONRenderer.
+
+    Args:
+        obj: Event dict
+        **kwargs: Options from the renderer (``default``)
+
+    Returns:
+        JSON text
+    """
+    return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS, **kwargs).decode()
 
 
 def configure_logging(
@@ -23,9 +36,19 @@ def configure_logging(
 
     # Configure standard library logging
     if log_format == "json":
-        # JSON format for production
-        formatter = jsonlogger.JsonFormatter(
-            "%(asctime)s %(name)s %(levelname)s %(message)s"
+        # JSON format for production, rendered by structlog with orjson.
+        # Records from plain stdlib loggers (uvicorn etc.) get the same fields.
+        formatter = structlog.stdlib.ProcessorFormatter(
+            processors=[
+                structlog.stdlib.ProcessorFormatter.remove_processors_meta,
+                structlog.processors.JSONRenderer(serializer=_orjson_dumps),
+            ],
+            foreign_pre_chain=[
+                structlog.stdlib.add_logger_name,
+                structlog.stdlib.add_log_level,
+                structlog.processors.TimeStamper(fmt="iso"),
+                structlog.processors.format_exc_info,
+            ],
         )
     else:
         # Text format for development
@@ -0,0 +1,667 @@
+"""Tests for chat endpoint."""
+
+import asyncio
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, Iterator, List, Tuple
+
+import orjson
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from structlog.testing import capture_logs
+
+from gemini_chat_backend.api.deps import get_client
+from gemini_chat_backend.api.endpoints import chat as chat_module
+from gemini_chat_backend.api.endpoints.chat import (
+    _DONE_FRAME,
+    _INTERNAL_ERROR_FRAME,
+    _coalesce_deltas,
+    _get_tool_definitions,
+    _group_tool_calls,
+    _PartialCall,
+    _serialize_tool_result,
+    _thought_step,
+    chat_stream,
+    sse,
+    to_deepseek_messages,
+)
+from gemini_chat_backend.api.responses import SSE_PING_FRAME, SSEResponse
+from gemini_chat_backend.main import create_app
+from gemini_chat_backend.models.chat import ChatRequest, Message, StreamEvent
+from gemini_chat_backend.tools.base import BaseTool, ToolResult
+from gemini_chat_backend.tools.registry import (
+    ToolRegistry,
+    get_tool_registry,
+    reset_tool_registry,
+)
+
+
+def format_sse(event: StreamEvent) -> bytes:
+    """Reference SSE encoder built on the StreamEvent model."""
+    return b"data: " + event.model_dump_json(by_alias=True).encode() + b"\n\n"
+
+
+class TestFormatSSE:
+    """Test suite for SSE frame formatting."""
+
+    def test_sse_returns_bytes_frame(self) -> None:
+        """Test that events are framed as SSE bytes."""
+        frame = sse("content", "Hello")
+
+        assert frame.startswith(b"data: ")
+        assert frame.endswith(b"\n\n")
+        assert StreamEvent.model_validate_json(frame[6:-2]) == StreamEvent(
+            type="content", data="Hello"
+        )
+
+    def test_sse_matches_format_sse(self) -> None:
+        """Test that the model-free fast path produces identical frames."""
+        data = {"toolCallId": "call-1", "result": {"stdout": "hi"}}
+        assert sse("tool_result", data) == format_sse(StreamEvent(type="tool_result", data=data))
+
+    def test_sse_frames_every_event_type(self) -> None:
+        """Test that each pre-encoded event head matches format_sse output."""
+        for event_type in ("content", "reasoning", "react_step", "react_step_delta", "error"):
+            event = StreamEvent(type=event_type, data="x")
+            assert sse(event_type, "x") == format_sse(event)
+
+    def test_done_frame_matches_formatted_event(self) -> None:
+        """Test that the pre-encoded done frame matches format_sse output."""
+        assert format_sse(StreamEvent(type="done", data=None)) == _DONE_FRAME
+
+    def test_internal_error_frame_matches_formatted_event(self) -> None:
+        """Test that the pre-encoded error frame matches format_sse output."""
+        event = StreamEvent(type="error", data={"message": "Internal server error"})
+        assert format_sse(event) == _INTERNAL_ERROR_FRAME
+
+
+class FakeDeepSeekClient:
+    """DeepSeek client stand-in that replays scripted turns of stream chunks."""
+
+    def __init__(self, turns: List[List[Dict[str, Any]]]) -> None:
+        self.turns = turns
+        self.calls = 0
+        self.sent_messages: List[List[Dict[str, Any]]] = []
+
+    async def chat(self, **kwargs: Any) -> AsyncIterator[Dict[str, Any]]:
+        self.sent_messages.append(list(kwargs["messages"]))
+        turn = self.turns[self.calls]
+        self.calls += 1
+        for delta in turn:
+            yield {"choices": [{"delta": delta}]}
+
+
+class EchoTool(BaseTool):
+    """Tool that returns its parameters."""
+
+    def __init__(self) -> None:
+        super().__init__(name="echo", description="Echo parameters")
+
+    async def execute(self, **kwargs: Any) -> ToolResult:
+        return ToolResult(success=True, result=kwargs)
+
+
+class RendezvousTool(BaseTool):
+    """Parallel-safe tool whose calls only finish once both have started."""
+
+    parallel_safe = True
+
+    def __init__(self) -> None:
+        super().__init__(name="rendezvous", description="Wait for a peer call")
+        self.started = 0
+        self.both_started = asyncio.Event()
+
+    async def execute(self, **kwargs: Any) -> ToolResult:
+        self.started += 1
+        if self.started == 2:
+            self.both_started.set()
+        await asyncio.wait_for(self.both_started.wait(), timeout=1.0)
+        return ToolResult(success=True, result=kwargs)
+
+
+class FailingTool(BaseTool):
+    """Tool whose execution always raises."""
+
+    def __init__(self) -> None:
+        super().__init__(name="fail", description="Always fail")
+
+    async def execute(self, **kwargs: Any) -> ToolResult:
+        raise RuntimeError("boom")
+
+
+def _tool_call_delta(index: int, call_id: str, name: str, arguments: str) -> Dict[str, Any]:
+    return {
+        "tool_calls": [
+            {
+                "index": index,
+                "id": call_id,
+                "function": {"name": name, "arguments": arguments},
+            }
+        ]
+    }
+
+
+async def _collect_events(
+    client: FakeDeepSeekClient, **request_fields: Any
+) -> List[Dict[str, Any]]:
+    request = ChatRequest(messages=[Message(role="user", content="Hi")], **request_fields)
+    events = []
+    async for frame in chat_stream(request, client, "test-request"):
+        events.append(orjson.loads(frame[6:-2]))
+    return events
+
+
+@pytest.fixture
+def registry() -> Iterator[ToolRegistry]:
+    """Provide a fresh global registry with the echo tool."""
+    reset_tool_registry()
+    registry = get_tool_registry()
+    registry.register(EchoTool())
+    yield registry
+    reset_tool_registry()
+
+
+class TestChatStream:
+    """Test suite for the ReAct chat stream."""
+
+    async def test_direct_answer_uses_single_llm_call(self, registry: ToolRegistry) -> None:
+        """Test that a direct answer streams content and finishes."""
+        client = FakeDeepSeekClient([[{"content": "Hel"}, {"content": "lo"}]])
+
+        events = await _collect_events(client)
+
+        assert client.calls == 1
+        assert [e["data"] for e in events if e["type"] == "content"] == ["Hello"]
+        assert events[-1] == {"type": "done", "data": None}
+
+    async def test_tool_turn_without_reasoning_synthesizes_one_thought(
+        self, registry: ToolRegistry
+    ) -> None:
+        """Test that tool calls without reasoning get a single local thought."""
+        client = FakeDeepSeekClient([
+            [
+                _tool_call_delta(0, "call-1", "echo", '{"a": 1}'),
+                _tool_call_delta(1, "call-2", "echo", '{"b": 2}'),
+            ],
+            [{"content": "Done"}],
+        ])
+
+        events = await _collect_events(client)
+
+        steps = [e["data"] for e in events if e["type"] == "react_step"]
+        thoughts = [s for s in steps if s["type"] == "thought"]
+        assert client.calls == 2
+        assert len(thoughts) == 1
+        assert thoughts[0]["leadsTo"] == "action"
+        assert [s["type"] for s in steps].count("action") == 2
+        results = [e["data"]["result"] for e in events if e["type"] == "tool_result"]
+        assert results == [{"a": 1}, {"b": 2}]
+
+    async def test_tool_exception_logged_with_request_id(self, registry: ToolRegistry) -> None:
+        """Test that a raising tool is reported and logged against its request."""
+        registry.register(FailingTool())
+        client = FakeDeepSeekClient([
+            [_tool_call_delta(0, "call-1", "fail", "{}")],
+            [{"content": "Done"}],
+        ])
+
+        with capture_logs() as logs:
+            events = await _collect_events(client)
+
+        errors = [e["data"] for e in events if e["type"] == "tool_error"]
+        assert [e["error"] for e in errors] == ["boom"]
+        [entry] = [log for log in logs if log.get("tool_name") == "fail"]
+        assert entry["request_id"] == "test-request"
+
+    async def test_tool_calls_ordered_by_index_without_gaps(
+        self, registry: ToolRegistry
+    ) -> None:
+        """Test that calls are executed in index order and missing indices are skipped."""
+        client = FakeDeepSeekClient([
+            [
+                _tool_call_delta(2, "call-b", "echo", '{"b": 2}'),
+                _tool_call_delta(0, "call-a", "echo", '{"a": 1}'),
+            ],
+            [{"content": "Done"}],
+        ])
+
+        events = await _collect_events(client)
+
+        calls = [e["data"]["id"] for e in events if e["type"] == "tool_call"]
+        assert calls == ["call-a", "call-b"]
+        assert not [e for e in events if e["type"] == "tool_error"]
+
+    async def test_reasoning_streams_deltas_and_closes_thought(
+        self, registry: ToolRegistry, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that reasoning is streamed as deltas and closed with a full step."""
+        monkeypatch.setattr(
+            chat_module,
+            "_DELTA_FLUSH_LIMITS",
+            {"content": (1, 0.0), "reasoning_content": (1, 0.0)},
+        )
+        client = FakeDeepSeekClient([
+            [
+                {"reasoning_content": "Let me check the weather."},
+                {"reasoning_content": " Then answer"},
+                {"content": "Answer"},
+            ]
+        ])
+
+        events = await _collect_events(client)
+
+        deltas = [e["data"] for e in events if e["type"] == "react_step_delta"]
+        steps = [e["data"] for e in events if e["type"] == "react_step"]
+        assert [d["delta"] for d in deltas] == [" Then answer"]
+        assert len(steps) == 2
+        assert steps[-1]["content"] == "Let me check the weather. Then answer"
+        assert steps[-1]["title"] == "Check the weather"
+        assert steps[-1]["leadsTo"] == "response"
+
+    async def test_long_reasoning_keeps_full_content_and_first_line_title(
+        self, registry: ToolRegistry, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that thoughts past the title window still close with all their text."""
+        monkeypatch.setattr(
+            chat_module,
+            "_DELTA_FLUSH_LIMITS",
+            {"content": (1, 0.0), "reasoning_content": (1, 0.0)},
+        )
+        pieces = ["Let me check the weather.\n"] + ["More detail. "] * 100
+        client = FakeDeepSeekClient([
+            [{"reasoning_content": piece} for piece in pieces] + [{"content": "Sunny"}]
+        ])
+
+        events = await _collect_events(client)
+
+        steps = [e["data"] for e in events if e["type"] == "react_step"]
+        assert steps[-1]["content"] == "".join(pieces)
+        assert steps[-1]["title"] == "Check the weather"
+
+    async def test_title_change_resends_full_thought(
+        self, registry: ToolRegistry, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a changed title is sent with the full step, not as a delta."""
+        monkeypatch.setattr(
+            chat_module,
+            "_DELTA_FLUSH_LIMITS",
+            {"content": (1, 0.0), "reasoning_content": (1, 0.0)},
+        )
+        client = FakeDeepSeekClient([
+            [
+                {"reasoning_content": "Let me think"},
+                {"reasoning_content": " about it."},
+                {"content": "Answer"},
+            ]
+        ])
+
+        events = await _collect_events(client)
+
+        assert not [e for e in events if e["type"] == "react_step_delta"]
+        steps = [e["data"] for e in events if e["type"] == "react_step"]
+        assert [s["title"] for s in steps] == ["Let me think", "Think about it"]
+        assert steps[-1]["content"] == "Let me think about it."
+
+    async def test_reasoning_hidden_but_kept_for_next_turn(
+        self, registry: ToolRegistry
+    ) -> None:
+        """Test that excluded reasoning is not streamed but still sent back to DeepSeek."""
+        client = FakeDeepSeekClient([
+            [
+                {"reasoning_content": "Use echo."},
+                _tool_call_delta(0, "call-1", "echo", "{}"),
+            ],
+            [{"content": "Done"}],
+        ])
+
+        events = await _collect_events(client, include_reasoning=False)
+
+        types = {e["type"] for e in events}
+        assert not types & {"reasoning", "react_step_delta"}
+        steps = [e["data"] for e in events if e["type"] == "react_step"]
+        assert [s["type"] for s in steps] == ["action", "observation"]
+        assistant = client.sent_messages[1][-2]
+        assert assistant["reasoning_content"] == "Use echo."
+
+    async def test_parallel_safe_tool_calls_run_concurrently(
+        self, registry: ToolRegistry
+    ) -> None:
+        """Test that parallel-safe tool calls in one turn overlap."""
+        registry.register(RendezvousTool())
+        client = FakeDeepSeekClient([
+            [
+                _tool_call_delta(0, "call-1", "rendezvous", '{"n": 1}'),
+                _tool_call_delta(1, "call-2", "rendezvous", '{"n": 2}'),
+            ],
+            [{"content": "Done"}],
+        ])
+
+        events = await _collect_events(client)
+
+        assert [e["type"] for e in events].count("tool_result") == 2
+        assert not [e for e in events if e["type"] == "tool_error"]
+        steps = [e["data"] for e in events if e["type"] == "react_step"]
+        actions = {s["id"] for s in steps if s["type"] == "action"}
+        observations = [s for s in steps if s["type"] == "observation"]
+        assert actions == {"action-call-1", "action-call-2"}
+        assert {o["actionId"] for o in observations} == actions
+        assert len({o["id"] for o in observations}) == 2
+
+    def test_thought_ids_unique_within_a_millisecond(self) -> None:
+        """Test that thoughts opened back to back get distinct IDs."""
+        ids = {_thought_step("x", None, "response")["id"] for _ in range(100)}
+
+        assert len(ids) == 100
+
+    def test_steps_use_epoch_millisecond_timestamps(self) -> None:
+        """Test that steps carry integer millisecond timestamps."""
+        step = _thought_step("x", None, "response")
+
+        assert isinstance(step["timestamp"], int)
+        assert step["timestamp"] > 1_600_000_000_000
+
+    def test_group_tool_calls_isolates_side_effecting_tools(
+        self, registry: ToolRegistry
+    ) -> None:
+        """Test that tools that are not parallel-safe run in their own batch."""
+        registry.register(RendezvousTool())
+        calls = [
+            _PartialCall(f"call-{i}", name)
+            for i, name in enumerate(["rendezvous", "echo", "rendezvous", "missing"])
+        ]
+
+        groups = _group_tool_calls(calls, registry)
+
+        assert [[c.name for c in g] for g in groups] == [
+            ["rendezvous"],
+            ["echo"],
+            ["rendezvous", "missing"],
+        ]
+        assert calls[1].tool is registry.get("echo")
+        assert calls[3].tool is None
+
+
+class TestPartialCall:
+    """Test suite for streamed tool call state."""
+
+    def test_parse_arguments_joins_fragments(self) -> None:
+        """Test that argument fragments are parsed as one JSON document."""
+        call = _PartialCall("call-1", "echo")
+        for fragment in ['{"pa', 'th": "a.', 'txt"}']:
+            call.arguments.extend(fragment.encode())
+
+        assert call.parse_arguments() == {"path": "a.txt"}
+
+    @pytest.mark.parametrize("arguments", [b"", b"{}", b'{"path": '])
+    def test_parse_arguments_empty_or_invalid(self, arguments: bytes) -> None:
+        """Test that missing or malformed arguments yield no parameters."""
+        assert _PartialCall("call-1", "echo", bytearray(arguments)).parse_arguments() == {}
+
+
+class TestCoalesceDeltas:
+    """Test suite for merging streamed text deltas."""
+
+    @staticmethod
+    async def _coalesce(deltas: List[Dict[str, Any]]) -> List[Tuple[str, Any]]:
+        async def chunks() -> AsyncIterator[Dict[str, Any]]:
+            for delta in deltas:
+                yield {"choices": [{"delta": delta}]}
+
+        return [d async for d in _coalesce_deltas(chunks())]
+
+    async def test_merges_until_field_changes(self) -> None:
+        """Test that text is merged per field and flushed in order."""
+        merged = await self._coalesce([
+            {"reasoning_content": "a"},
+            {"reasoning_content": "b"},
+            {"content": "c"},
+            {"content": "d"},
+        ])
+
+        assert merged == [("reasoning_content", "ab"), ("content", "cd")]
+
+    async def test_flushes_before_tool_calls(self) -> None:
+        """Test that buffered text precedes tool call deltas."""
+        tool_delta = _tool_call_delta(0, "call-1", "echo", "{}")
+
+        merged = await self._coalesce([{"content": "x"}, tool_delta, {"content": "y"}])
+
+        assert merged == [
+            ("content", "x"),
+            ("tool_calls", tool_delta["tool_calls"]),
+            ("content", "y"),
+        ]
+
+    async def test_flushes_at_size_limit(self) -> None:
+        """Test that a full buffer is flushed without waiting for the window."""
+        max_chars, _ = chat_module._DELTA_FLUSH_LIMITS["content"]
+
+        merged = await self._coalesce([{"content": "x" * max_chars}, {"content": "y"}])
+
+        assert merged == [("content", "x" * max_chars), ("content", "y")]
+
+    async def test_size_window_grows_after_full_flush(self) -> None:
+        """Test that a window filled before its time limit doubles."""
+        max_chars, _ = chat_module._DELTA_FLUSH_LIMITS["content"]
+        first, second, third = "x" * max_chars, "y" * max_chars, "z" * max_chars
+
+        merged = await self._coalesce([{"content": first}, {"content": second}, {"content": third}])
+
+        assert merged == [("content", first), ("content", second + third)]
+
+    async def test_flushes_buffer_before_upstream_error(self) -> None:
+        """Test that buffered text is delivered before a stream failure."""
+
+        async def chunks() -> AsyncIterator[Dict[str, Any]]:
+            yield {"choices": [{"delta": {"content": "partial"}}]}
+            raise RuntimeError("connection lost")
+
+        merged = []
+        with pytest.raises(RuntimeError):
+            async for delta in _coalesce_deltas(chunks()):
+                merged.append(delta)
+
+        assert merged == [("content", "partial")]
+
+    async def test_flushes_within_window_while_upstream_stalls(self) -> None:
+        """Test that buffered text is sent when the window expires, not at the next chunk."""
+        resume = asyncio.Event()
+        _, window = chat_module._DELTA_FLUSH_LIMITS["content"]
+
+        async def chunks() -> AsyncIterator[Dict[str, Any]]:
+            yield {"choices": [{"delta": {"content": "Hi"}}]}
+            await resume.wait()
+            yield {"choices": [{"delta": {"content": " there"}}]}
+
+        deltas = _coalesce_deltas(chunks())
+        async with asyncio.timeout(window + 0.5):
+            assert await anext(deltas) == ("content", "Hi")
+
+        resume.set()
+        assert [d async for d in deltas] == [("content", " there")]
+
+    async def test_close_cancels_pending_upstream_read(self) -> None:
+        """Test that closing mid-stream stops the in-flight upstream read."""
+        closed = asyncio.Event()
+
+        async def chunks() -> AsyncIterator[Dict[str, Any]]:
+            try:
+                yield {"choices": [{"delta": {"content": "Hi"}}]}
+                await asyncio.Event().wait()
+            finally:
+                closed.set()
+
+        deltas = _coalesce_deltas(chunks())
+        assert await anext(deltas) == ("content", "Hi")
+        await deltas.aclose()
+
+        async with asyncio.timeout(1):
+            await closed.wait()
+
+
+class TestDeepSeekPayload:
+    """Test suite for the request prefix sent to DeepSeek."""
+
+    def test_messages_drop_extra_client_fields(self) -> None:
+        """Test that per-request extras never reach the prompt."""
+        messages = [
+            Message(role="user", content="Hi", id="m-1", timestamp=1700000000),
+            Message(role="tool", content="ok", toolCallId="call-1"),
+        ]
+
+        assert to_deepseek_messages(messages) == [
+            {"role": "user", "content": "Hi"},
+            {"role": "tool", "content": "ok", "tool_call_id": "call-1"},
+        ]
+
+    def test_messages_normalize_camel_case_aliases(self) -> None:
+        """Test that aliased client fields are sent under DeepSeek's names."""
+        tool_calls = [{"id": "call-1", "type": "function", "function": {"name": "echo"}}]
+        message = ChatRequest.model_validate({
+            "messages": [
+                {
+                    "role": "assistant",
+                    "content": "",
+                    "toolCalls": tool_calls,
+                    "reasoningContent": "Use echo.",
+                }
+            ]
+        }).messages[0]
+
+        assert to_deepseek_messages([message]) == [
+            {
+                "role": "assistant",
+                "content": "",
+                "tool_calls": tool_calls,
+                "reasoning_content": "Use echo.",
+            }
+        ]
+
+    def test_tool_definitions_independent_of_registration_order(self) -> None:
+        """Test that tool definitions are canonically ordered."""
+        registry = ToolRegistry()
+        registry.register(RendezvousTool())
+        registry.register(EchoTool())
+
+        tools = _get_tool_definitions(registry)
+
+        assert [t["function"]["name"] for t in tools] == ["echo", "rendezvous"]
+        assert list(tools[0]) == ["function", "type"]
+        assert _get_tool_definitions(registry) is tools
+
+
+class TestChatEndpoint:
+    """Test suite for the chat route."""
+
+    @pytest.fixture
+    def http_client(self, registry: ToolRegistry) -> TestClient:
+        """Provide a client for the app backed by a scripted DeepSeek client."""
+        app = create_app()
+        app.dependency_overrides[get_client] = lambda: FakeDeepSeekClient(
+            [[{"content": "Hi there"}]]
+        )
+        return TestClient(app)
+
+    def test_streams_chat_for_valid_body(self, http_client: TestClient) -> None:
+        """Test that a valid JSON body is parsed and streamed."""
+        response = http_client.post(
+            "/api/v1/chat",
+            json={"messages": [{"role": "user", "content": "Hi"}], "include_reasoning": False},
+        )
+
+        assert response.status_code == 200
+        assert b'"data":"Hi there"' in response.content
+
+    def test_invalid_body_returns_validation_error(self, http_client: TestClient) -> None:
+        """Test that invalid bodies are rejected like FastAPI body models."""
+        response = http_client.post("/api/v1/chat", json={"messages": [{"role": "bot"}]})
+
+        assert response.status_code == 422
+        locs = [error["loc"] for error in response.json()["detail"]]
+        assert ["body", "messages", 0, "role"] in locs
+
+    def test_request_body_documented(self, http_client: TestClient) -> None:
+        """Test that the OpenAPI schema still describes the request body."""
+        operation = http_client.get("/openapi.json").json()["paths"]["/api/v1/chat"]["post"]
+
+        schema = operation["requestBody"]["content"]["application/json"]["schema"]
+        assert schema["properties"]["messages"]["items"]["properties"]["role"]["enum"]
+
+
+class TestSSEResponse:
+    """Test suite for the raw ASGI SSE response."""
+
+    def test_streams_frames_with_sse_headers(self) -> None:
+        """Test that frames are streamed unchanged with SSE headers."""
+
+        async def frames() -> AsyncIterator[bytes]:
+            yield format_sse(StreamEvent(type="content", data="Hi"))
+            yield _DONE_FRAME
+
+        app = FastAPI()
+
+        @app.get("/stream")
+        async def stream() -> SSEResponse:
+            return SSEResponse(frames(), headers={"X-Request-ID": "abc"})
+
+        response = TestClient(app).get("/stream")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        assert response.headers["cache-control"] == "no-cache"
+        assert response.headers["x-request-id"] == "abc"
+        assert response.content == b'data: {"type":"content","data":"Hi"}\n\n' + _DONE_FRAME
+
+    def test_sends_keep_alive_while_idle(self) -> None:
+        """Test that an idle stream gets comment pings between frames."""
+
+        async def frames() -> AsyncIterator[bytes]:
+            await asyncio.sleep(0.1)
+            yield _DONE_FRAME
+
+        app = FastAPI()
+
+        @app.get("/stream")
+        async def stream() -> SSEResponse:
+            return SSEResponse(frames(), ping_interval=0.02)
+
+        response = TestClient(app).get("/stream")
+
+        assert response.content.startswith(SSE_PING_FRAME)
+        assert response.content.endswith(_DONE_FRAME)
+
+    async def test_reads_ahead_of_slow_client(self) -> None:
+        """Test that frames are produced while the client is still writing."""
+        produced: List[int] = []
+        sent: List[int] = []
+
+        async def frames() -> AsyncIterator[bytes]:
+            for i in range(3):
+                produced.append(i)
+                yield b"x"
+
+        async def send(message: Dict[str, Any]) -> None:
+            if message["type"] == "http.response.body":
+                sent.append(len(produced))
+                await asyncio.sleep(0.01)
+
+        async def receive() -> Dict[str, Any]:
+            await asyncio.sleep(10)
+            return {"type": "http.disconnect"}
+
+        await SSEResponse(frames(), ping_interval=None)({"type": "http"}, receive, send)
+
+        assert sent[1] == 3
+
+
+class TestSerializeToolResult:
+    """Test suite for tool result serialization."""
+
+    def test_result_serialized_to_json(self) -> None:
+        """Test that results serialize to a compact JSON string."""
+        assert _serialize_tool_result({"stdout": "hi"}) == '{"stdout":"hi"}'
+
+    def test_unsupported_types_stringified(self) -> None:
+        """Test that values orjson cannot encode fall back to str()."""
+        value = {"path": Path("a")}
+        assert orjson.loads(_serialize_tool_result(value)) == {"path": "a"}
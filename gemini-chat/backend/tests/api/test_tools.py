@@ -0,0 +1,77 @@
+"""Tests for tools endpoints."""
+
+from typing import Any, Iterator
+
+import pytest
+from fastapi.testclient import TestClient
+
+from gemini_chat_backend.main import create_app
+from gemini_chat_backend.tools.base import BaseTool, ToolResult
+from gemini_chat_backend.tools.registry import get_tool_registry, reset_tool_registry
+
+
+class NoopTool(BaseTool):
+    """Tool that does nothing."""
+
+    def __init__(self, name: str) -> None:
+        super().__init__(name=name, description="Do nothing")
+
+    async def execute(self, **kwargs: Any) -> ToolResult:
+        return ToolResult(success=True)
+
+
+@pytest.fixture
+def client() -> Iterator[TestClient]:
+    """Provide a client with an empty global tool registry."""
+    reset_tool_registry()
+    yield TestClient(create_app())
+    reset_tool_registry()
+
+
+class TestListTools:
+    """Test suite for the tools listing."""
+
+    def test_lists_registered_tools(self, client: TestClient) -> None:
+        """Test that registered tools are listed as JSON."""
+        get_tool_registry().register(NoopTool("noop"))
+
+        response = client.get("/api/v1/tools")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
+        assert [t["name"] for t in response.json()["tools"]] == ["noop"]
+
+    def test_listing_follows_registry_changes(self, client: TestClient) -> None:
+        """Test that the cached listing is rebuilt when tools change."""
+        registry = get_tool_registry()
+        registry.register(NoopTool("first"))
+        client.get("/api/v1/tools")
+
+        registry.register(NoopTool("second"))
+        response = client.get("/api/v1/tools")
+
+        assert [t["name"] for t in response.json()["tools"]] == ["first", "second"]
+
+
+class TestExecuteTool:
+    """Test suite for direct tool execution."""
+
+    def test_executes_registered_tool(self, client: TestClient) -> None:
+        """Test that a registered tool runs and reports success."""
+        get_tool_registry().register(NoopTool("noop"))
+
+        response = client.post(
+            "/api/v1/tools/execute", json={"tool_name": "noop", "parameters": {}}
+        )
+
+        assert response.json() == {"success": True, "result": None, "error": None}
+
+    def test_unknown_tool_reports_error(self, client: TestClient) -> None:
+        """Test that unknown tools get a not-found response on every call."""
+        for _ in range(2):
+            response = client.post(
+                "/api/v1/tools/execute", json={"tool_name": "missing", "parameters": {}}
+            )
+
+            assert response.status_code == 200
+            assert response.json()["error"] == "Tool 'missing' not found"
@@ -1,12 +1,16 @@
 """Tests for DeepSeek client."""
 
 import json
+import sys
+import types
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import httpx
 import pytest
 
-from gemini_chat_backend.core.deepseek import DeepSeekClient, DeepSeekError
+from gemini_chat_backend.config import settings
+from gemini_chat_backend.core.deepseek import DeepSeekClient, DeepSeekError, _split_lines
+from gemini_chat_backend.core.llm_cache import LLMCache
 
 
 class TestDeepSeekClient:
@@ -29,16 +33,6 @@ class TestDeepSeekClient:
         assert client.headers["Authorization"] == "Bearer test_key"
         assert client.headers["Content-Type"] == "application/json"
 
-    def test_prepare_messages_with_system_prompt(self, client: DeepSeekClient) -> None:
-        """Test message preparation with system prompt."""
-        messages = [{"role": "user", "content": "Hello"}]
-
-        result = client._prepare_messages(messages, system_prompt="You are helpful")
-
-        assert result[0]["role"] == "system"
-        assert result[0]["content"] == "You are helpful"
-        assert result[1]["role"] == "user"
-
     def test_prepare_messages_sanitizes_reasoning_content(self, client: DeepSeekClient) -> None:
         """Test that reasoning_content is sanitized correctly."""
         messages = [
@@ -62,6 +56,19 @@ class TestDeepSeekClient:
         # Second message should have reasoning_content removed
         assert "reasoning_content" not in result[1]
 
+    def test_prepare_messages_leaves_input_unchanged(self, client: DeepSeekClient) -> None:
+        """Test that sanitizing copies messages instead of modifying them."""
+        messages = [
+            {"role": "assistant", "content": "A", "tool_calls": [{"id": "1"}]},
+            {"role": "assistant", "content": "B", "reasoning_content": "Dropped"},
+        ]
+
+        result = client._prepare_messages(messages)
+
+        assert result[0]["reasoning_content"] == ""
+        assert "reasoning_content" not in messages[0]
+        assert messages[1]["reasoning_content"] == "Dropped"
+
     @pytest.mark.asyncio
     async def test_chat_streaming_success(self, client: DeepSeekClient) -> None:
         """Test successful streaming chat."""
@@ -103,3 +110,168 @@ class TestDeepSeekClient:
                     pass
 
             assert "DeepSeek API error" in str(exc_info.value)
+
+    def test_encode_payload_matches_plain_json(self, client: DeepSeekClient) -> None:
+        """Test that the spliced request body decodes to the full payload."""
+        tools = [{"type": "function", "function": {"name": "echo"}}]
+        payload = {
+            "model": "test-model",
+            "messages": [{"role": "user", "content": "Hi"}],
+            "stream": True,
+            "tools": tools,
+        }
+
+        body = client._encode_payload(payload, system_prompt="Be brief")
+
+        assert json.loads(body) == {
+            **payload,
+            "messages": [
+                {"role": "system", "content": "Be brief"},
+                {"role": "user", "content": "Hi"},
+            ],
+        }
+
+    def test_encode_payload_reuses_constant_parts(self, client: DeepSeekClient) -> None:
+        """Test that system prompt and tools are encoded once per object."""
+        tools = [{"type": "function", "function": {"name": "echo"}}]
+        payload = {"model": "m", "messages": [], "stream": True, "tools": tools}
+
+        first = client._encode_payload(payload, system_prompt="Be brief")
+        encoded_tools = client._encoded[id(tools)][1]
+        second = client._encode_payload(payload, system_prompt="Be brief")
+
+        assert first == second
+        assert client._encoded[id(tools)][1] is encoded_tools
+        assert json.loads(first)["messages"] == [{"role": "system", "content": "Be brief"}]
+
+    @pytest.fixture
+    def aiohttp_backend(self, monkeypatch: pytest.MonkeyPatch) -> types.ModuleType:
+        """Select the aiohttp backend, standing in for aiohttp if it is not installed."""
+        try:
+            import aiohttp
+        except ImportError:
+            aiohttp = types.ModuleType("aiohttp")
+            aiohttp.ClientError = type("ClientError", (Exception,), {})
+            monkeypatch.setitem(sys.modules, "aiohttp", aiohttp)
+        monkeypatch.setattr(settings, "DEEPSEEK_HTTP_BACKEND", "aiohttp")
+        return aiohttp
+
+    @staticmethod
+    def _mock_session(response: MagicMock) -> MagicMock:
+        """Build a session whose post() yields the given response."""
+        request = MagicMock()
+        request.__aenter__ = AsyncMock(return_value=response)
+        request.__aexit__ = AsyncMock(return_value=None)
+        session = MagicMock()
+        session.post.return_value = request
+        return session
+
+    @pytest.mark.asyncio
+    async def test_chat_streaming_over_aiohttp(
+        self, client: DeepSeekClient, aiohttp_backend: types.ModuleType
+    ) -> None:
+        """Test that the aiohttp backend parses streamed SSE chunks."""
+
+        async def iter_any():
+            yield b'data: {"choices": [{"delta": {"content": "He"}}]}\n\ndata: {"cho'
+            yield b'ices": [{"delta": {"content": "llo"}}]}\n\ndata: [DONE]\n\n'
+
+        response = MagicMock(status=200)
+        response.content.iter_any = iter_any
+        session = self._mock_session(response)
+
+        with patch.object(client, "_get_session", return_value=session):
+            chunks = [chunk async for chunk in client.chat([{"role": "user", "content": "Hi"}])]
+
+        assert [c["choices"][0]["delta"]["content"] for c in chunks] == ["He", "llo"]
+        assert json.loads(session.post.call_args.kwargs["data"])["stream"] is True
+
+    @pytest.mark.asyncio
+    async def test_aiohttp_errors_raised_as_deepseek_error(
+        self, client: DeepSeekClient, aiohttp_backend: types.ModuleType
+    ) -> None:
+        """Test that aiohttp status and client errors become DeepSeekError."""
+        response = MagicMock(status=500)
+        response.text = AsyncMock(return_value="Server Error")
+
+        with (
+            patch.object(client, "_get_session", return_value=self._mock_session(response)),
+            pytest.raises(DeepSeekError, match="500 - Server Error"),
+        ):
+            async for _ in client.chat([{"role": "user", "content": "Hi"}]):
+                pass
+
+        session = MagicMock()
+        session.post.side_effect = aiohttp_backend.ClientError("refused")
+        with (
+            patch.object(client, "_get_session", return_value=session),
+            pytest.raises(DeepSeekError, match="request error: refused"),
+        ):
+            async for _ in client.chat([{"role": "user", "content": "Hi"}]):
+                pass
+
+    @pytest.mark.asyncio
+    async def test_http_client_reused_until_closed(self, client: DeepSeekClient) -> None:
+        """Test that the HTTP client is shared across calls and released by aclose."""
+        http = client._get_http()
+        assert client._get_http() is http
+
+        await client.aclose()
+
+        assert http.is_closed
+        assert client._get_http() is not http
+        await client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_identical_requests_served_from_cache(self, client: DeepSeekClient) -> None:
+        """Test that a repeated request replays the cached response."""
+        calls = []
+
+        async def send(body, payload, stream):
+            calls.append(body)
+            yield {"choices": [{"delta": {"content": "Hi"}}]}
+
+        client._cache = LLMCache(ttl=60)
+        messages = [{"role": "user", "content": "Hello"}]
+        with patch.object(client, "_send", side_effect=send):
+            first = [chunk async for chunk in client.chat(messages=messages)]
+            second = [chunk async for chunk in client.chat(messages=messages)]
+
+        assert first == second
+        assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_parse_lines_stops_at_done(self, client: DeepSeekClient) -> None:
+        """Test that SSE lines are parsed up to [DONE], skipping bad chunks."""
+
+        async def lines():
+            yield b'data: {"id": 1}'
+            yield b""
+            yield b"data: {broken"
+            yield b"data: [DONE]"
+            yield b'data: {"id": 2}'
+
+        chunks = [chunk async for chunk in client._parse_lines(lines())]
+
+        assert chunks == [{"id": 1}]
+
+    @pytest.mark.asyncio
+    async def test_split_lines_across_chunk_boundaries(self) -> None:
+        """Test that lines split across chunks are reassembled."""
+
+        async def chunks():
+            for chunk in [b"data: a", b"b\r\n\nda", b"ta: c\n", b"tail"]:
+                yield chunk
+
+        lines = [line async for line in _split_lines(chunks())]
+
+        assert lines == [b"data: ab", b"", b"data: c", b"tail"]
+
+    @pytest.mark.asyncio
+    async def test_http_client_carries_auth_headers(self, client: DeepSeekClient) -> None:
+        """Test that auth headers are set once on the shared HTTP client."""
+        http = client._get_http()
+
+        assert http.headers["Authorization"] == "Bearer test_key"
+        assert http.timeout.read == 120.0
+        await client.aclose()
@@ -0,0 +1,38 @@
+"""Tests for the DeepSeek response cache."""
+
+from unittest.mock import patch
+
+from gemini_chat_backend.core.llm_cache import LLMCache
+
+
+class TestLLMCache:
+    """Test suite for LLMCache."""
+
+    def test_returns_stored_chunks(self) -> None:
+        """Test that stored chunks are returned for the same key."""
+        cache = LLMCache(ttl=60)
+        cache.set(b"key", [{"id": 1}])
+
+        assert cache.get(b"key") == [{"id": 1}]
+        assert cache.get(b"other") is None
+
+    def test_entries_expire_after_ttl(self) -> None:
+        """Test that expired entries are treated as misses."""
+        cache = LLMCache(ttl=60)
+        with patch("gemini_chat_backend.core.llm_cache.time.monotonic", return_value=0.0):
+            cache.set(b"key", [])
+
+        with patch("gemini_chat_backend.core.llm_cache.time.monotonic", return_value=61.0):
+            assert cache.get(b"key") is None
+
+    def test_evicts_least_recently_used(self) -> None:
+        """Test that the least recently used entry is evicted when full."""
+        cache = LLMCache(ttl=60, max_entries=2)
+        cache.set(b"a", [])
+        cache.set(b"b", [])
+        cache.get(b"a")
+
+        cache.set(b"c", [])
+
+        assert cache.get(b"b") is None
+        assert cache.get(b"a") == []
@@ -0,0 +1,47 @@
+"""Tests for reasoning parser."""
+
+from gemini_chat_backend.core.reasoning_parser import (
+    extract_thought_title,
+    parse_reasoning_into_segments,
+)
+
+
+class TestExtractThoughtTitle:
+    """Test suite for extract_thought_title."""
+
+    def test_empty_reasoning_has_no_title(self) -> None:
+        """Test that blank reasoning yields no title."""
+        assert extract_thought_title("") is None
+        assert extract_thought_title(" \n ") is None
+
+    def test_title_from_action_starter(self) -> None:
+        """Test that an action-oriented first line becomes the title."""
+        title = extract_thought_title("Let me check the weather API.\nThen summarize it.")
+
+        assert title == "Check the weather API"
+
+    def test_title_falls_back_to_first_sentence(self) -> None:
+        """Test that the first sentence is used when no pattern matches."""
+        title = extract_thought_title("The user wants a summary! More detail follows.")
+
+        assert title == "The user wants a summary"
+
+    def test_title_stable_as_reasoning_grows(self) -> None:
+        """Test that text after the first line does not change the title."""
+        head = "1. Analyze the request.\n"
+
+        assert extract_thought_title(head) == extract_thought_title(head + "More text. " * 1000)
+
+
+class TestParseReasoningIntoSegments:
+    """Test suite for parse_reasoning_into_segments."""
+
+    def test_step_indicators_start_segments(self) -> None:
+        """Test that numbered, bulleted and keyword lines open new segments."""
+        reasoning = "1. Read the file\nit is long\n- check syntax\nThen report back"
+
+        assert parse_reasoning_into_segments(reasoning) == [
+            "1. Read the file it is long",
+            "- check syntax",
+            "Then report back",
+        ]
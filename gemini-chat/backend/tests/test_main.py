@@ -1,8 +1,11 @@
 """Tests for main FastAPI application."""
 
+import sys
+
 import pytest
 from fastapi.testclient import TestClient
 
+from gemini_chat_backend.config import settings
 from gemini_chat_backend.main import app, create_app
 
 
@@ -36,6 +39,14 @@ class TestAppCreation:
         test_app = create_app()
         assert test_app.title == "Gemini Chat Backend"
 
+    def test_startup_fails_without_aiohttp(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that the aiohttp backend is checked at startup, not per request."""
+        monkeypatch.setattr(settings, "DEEPSEEK_HTTP_BACKEND", "aiohttp")
+        monkeypatch.setitem(sys.modules, "aiohttp", None)
+
+        with pytest.raises(RuntimeError, match="requires aiohttp"), TestClient(create_app()):
+            pass
+
 
 class TestAppInstance:
     """Test suite for the global app instance."""
@@ -1,105 +1,151 @@
 """Test code_analyzer.py for code safety analysis."""
+import ast
+from functools import lru_cache
+
 import pytest
 
-from gemini_chat_backend.tools.code_analyzer import CodeAnalyzer
+from gemini_chat_backend.tools.code_analyzer import CodeAnalyzer, is_code_safe
+
+
+# The analyzer keeps no per-call state, so one instance serves every test
+@pytest.fixture(scope="module")
+def analyzer():
+    return CodeAnalyzer()
+
+
+# Many snippets recur across tests; the analyzer only reads the tree, so
+# parsing each distinct source once is safe while this module runs
+@pytest.fixture(scope="module", autouse=True)
+def memoized_ast_parse():
+    parse = ast.parse
+    parse_source = lru_cache(maxsize=256)(parse)
+
+    def cached_parse(source, *args, **kwargs):
+        if args or kwargs or not isinstance(source, str):
+            return parse(source, *args, **kwargs)
+        return parse_source(source)
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(ast, "parse", cached_parse)
+        yield
+
+
+BLOCKED = "modification operations"
+
+# (code, expected_safe, substring the error must contain when unsafe)
+PYTHON_CASES = [
+    pytest.param("print('hello')", True, None, id="print"),
+    # os: read-only calls are allowed
+    pytest.param("import os; print(os.getcwd())", True, None, id="os_getcwd"),
+    pytest.param("import os; print(os.listdir('.'))", True, None, id="os_listdir"),
+    pytest.param("import os; print(os.path.join('a', 'b'))", True, None, id="os_path_join"),
+    pytest.param(
+        "import os.path; print(os.path.join('a', 'b'))", True, None, id="import_os_path"
+    ),
+    pytest.param("from os import getcwd; print(getcwd())", True, None, id="from_os_getcwd"),
+    pytest.param(
+        "from os.path import join; print(join('a', 'b'))", True, None, id="from_os_path_join"
+    ),
+    pytest.param(
+        "import os as operating_system; print(operating_system.getcwd())", True, None,
+        id="os_alias_getcwd",
+    ),
+    # os: modifying calls are blocked
+    pytest.param("import os; os.system('ls')", False, BLOCKED, id="os_system"),
+    pytest.param("import os; os.remove('file.txt')", False, BLOCKED, id="os_remove"),
+    pytest.param("import os; os.rename('a', 'b')", False, BLOCKED, id="os_rename"),
+    pytest.param("import os; os.mkdir('test')", False, BLOCKED, id="os_mkdir"),
+    pytest.param("from os import system; system('ls')", False, BLOCKED, id="from_os_system"),
+    pytest.param("import os as o; o.system('ls')", False, BLOCKED, id="os_alias_system"),
+    # sys
+    pytest.param("import sys; print(sys.version)", True, None, id="sys_version"),
+    pytest.param("import sys; print(sys.platform)", True, None, id="sys_platform"),
+    pytest.param("import sys; print(sys.argv)", True, None, id="sys_argv"),
+    pytest.param("from sys import version; print(version)", True, None, id="from_sys_version"),
+    pytest.param("import sys as s; print(s.version)", True, None, id="sys_alias_version"),
+    # subprocess
+    pytest.param(
+        "import subprocess; subprocess.run(['ls'])", False, BLOCKED, id="subprocess_run"
+    ),
+    pytest.param(
+        "from subprocess import run; run(['ls'])", False, BLOCKED, id="from_subprocess_run"
+    ),
+    pytest.param(
+        "import subprocess as sp; sp.call(['ls'])", False, BLOCKED, id="subprocess_alias_call"
+    ),
+    # shutil
+    pytest.param("import shutil; shutil.copy('a', 'b')", False, BLOCKED, id="shutil_copy"),
+    pytest.param(
+        "from shutil import copy; copy('a', 'b')", False, BLOCKED, id="from_shutil_copy"
+    ),
+]
+
+JS_CASES = [
+    pytest.param("console.log('hello')", True, None, id="console_log"),
+    pytest.param("console.log(process.cwd())", True, None, id="process_cwd"),
+    pytest.param("const x = 1 + 2;", True, None, id="arithmetic"),
+    pytest.param(
+        "function add(a, b) { return a + b; }", True, None, id="function_declaration"
+    ),
+    pytest.param("const arr = [1, 2, 3];", True, None, id="array_literal"),
+    # fs writes
+    pytest.param(
+        "const fs = require('fs'); fs.writeFile('test.txt', 'data')", False, BLOCKED,
+        id="fs_write_file",
+    ),
+    pytest.param(
+        "require('fs').appendFile('test.txt', 'more')", False, BLOCKED, id="fs_append_file"
+    ),
+    pytest.param("fs.unlink('file.txt')", False, BLOCKED, id="fs_unlink"),
+    pytest.param("fs.mkdir('test')", False, BLOCKED, id="fs_mkdir"),
+    pytest.param("fs.rename('a', 'b')", False, BLOCKED, id="fs_rename"),
+    # eval and the Function constructor
+    pytest.param("eval('alert(1)')", False, BLOCKED, id="eval"),
+    pytest.param("new Function('return 1')()", False, BLOCKED, id="function_constructor"),
+    # child_process
+    pytest.param(
+        "require('child_process').exec('ls')", False, BLOCKED, id="child_process_exec"
+    ),
+    pytest.param(
+        "const { spawn } = require('child_process'); spawn('ls')", False, BLOCKED,
+        id="child_process_spawn",
+    ),
+]
 
 
 class TestCodeAnalyzer:
     """Test code analyzer functionality."""
 
-    @pytest.fixture
-    def analyzer(self):
-        return CodeAnalyzer()
-
     def test_init(self, analyzer):
         """Test analyzer initialization."""
         assert hasattr(analyzer, 'python_modification_keywords')
         assert hasattr(analyzer, 'js_modification_keywords')
         assert hasattr(analyzer, 'restricted_modules')
-        assert hasattr(analyzer, 'module_aliases')
 
-    def test_analyze_python_simple_safe(self, analyzer):
-        """Test analysis of simple safe Python code."""
-        code = "print('hello')"
+    @pytest.mark.parametrize("code, expected_safe, error_substring", PYTHON_CASES)
+    def test_analyze_python(self, analyzer, code, expected_safe, error_substring):
+        """Test Python analysis against the case table."""
         safe, error, ops = analyzer.analyze_python_code(code)
-        assert safe
-        assert error is None
-        assert ops == []
-
-    def test_analyze_python_with_safe_os_import(self, analyzer):
-        """Test analysis with safe os import and function calls."""
-        test_cases = [
-            ("import os; print(os.getcwd())", True),
-            ("import os; print(os.listdir('.'))", True),
-            ("import os; print(os.path.join('a', 'b'))", True),
-            ("import os.path; print(os.path.join('a', 'b'))", True),
-            ("from os import getcwd; print(getcwd())", True),
-            ("from os.path import join; print(join('a', 'b'))", True),
-            ("import os as operating_system; print(operating_system.getcwd())", True),
-        ]
-
-        for code, expected_safe in test_cases:
-            safe, error, ops = analyzer.analyze_python_code(code)
-            assert safe == expected_safe, f"Failed for code: {code}. Error: {error}"
-            if not safe:
-                assert error is not None
-
-    def test_analyze_python_with_dangerous_os_calls(self, analyzer):
-        """Test analysis blocking dangerous os function calls."""
-        test_cases = [
-            ("import os; os.system('ls')", False),
-            ("import os; os.remove('file.txt')", False),
-            ("import os; os.rename('a', 'b')", False),
-            ("import os; os.mkdir('test')", False),
-            ("from os import system; system('ls')", False),
-            ("import os as o; o.system('ls')", False),
-        ]
-
-        for code, expected_safe in test_cases:
-            safe, error, ops = analyzer.analyze_python_code(code)
-            assert safe == expected_safe, f"Failed for code: {code}"
-            if not safe:
-                assert "modification operations" in error.lower()
-                assert len(ops) > 0
-
-    def test_analyze_python_with_sys_functions(self, analyzer):
-        """Test analysis with sys module functions."""
-        test_cases = [
-            ("import sys; print(sys.version)", True),
-            ("import sys; print(sys.platform)", True),
-            ("import sys; print(sys.argv)", True),
-            ("from sys import version; print(version)", True),
-            ("import sys as s; print(s.version)", True),
-        ]
-
-        for code, expected_safe in test_cases:
-            safe, error, ops = analyzer.analyze_python_code(code)
-            assert safe == expected_safe, f"Failed for code: {code}. Error: {error}"
-
-    def test_analyze_python_block_subprocess(self, analyzer):
-        """Test analysis blocking subprocess calls."""
-        test_cases = [
-            ("import subprocess; subprocess.run(['ls'])", False),
-            ("from subprocess import run; run(['ls'])", False),
-            ("import subprocess as sp; sp.call(['ls'])", False),
-        ]
-
-        for code, expected_safe in test_cases:
-            safe, error, ops = analyzer.analyze_python_code(code)
-            assert safe == expected_safe, f"Failed for code: {code}"
-            if not safe:
-                assert "subprocess" in error.lower() or "modification" in error.lower()
-
-    def test_analyze_python_block_shutil(self, analyzer):
-        """Test analysis blocking shutil calls."""
-        test_cases = [
-            ("import shutil; shutil.copy('a', 'b')", False),
-            ("from shutil import copy; copy('a', 'b')", False),
-        ]
-
-        for code, expected_safe in test_cases:
-            safe, error, ops = analyzer.analyze_python_code(code)
-            assert safe == expected_safe, f"Failed for code: {code}"
+        assert safe == expected_safe, f"Failed for code: {code}. Error: {error}"
+        if safe:
+            assert error is None
+            assert ops == []
+        else:
+            assert error_substring in error
+            assert len(ops) > 0
+
+    def test_analyze_python_alias_imported_after_use(self, analyzer):
+        """Test that aliases are resolved even when imported after their use."""
+        code = "sh.rmtree('a')\ndef setup():\n    import shutil as sh"
+        safe, error, ops = analyzer.analyze_python_code(code)
+        assert safe is False
+        assert ops == ["call to shutil.rmtree"]
+
+    def test_analyze_python_normalized_identifiers(self, analyzer):
+        """Test that fullwidth identifiers, which the parser normalizes, are checked."""
+        safe, error, ops = analyzer.analyze_python_code("\uff4f\uff50\uff45\uff4e('f')")
+        assert safe is False
+        assert ops == ["call to open"]
 
     def test_analyze_python_syntax_error(self, analyzer):
         """Test analysis with Python syntax error."""
@@ -109,64 +155,23 @@ class TestCodeAnalyzer:
         # Just ensure no exception is raised
         assert error is None or "syntax error" in error.lower()
 
-    def test_analyze_javascript_simple_safe(self, analyzer):
-        """Test analysis of simple safe JavaScript code."""
-        code = "console.log('hello')"
+    def test_analyze_blank_code_is_safe(self, analyzer):
+        """Test that empty and whitespace-only code is safe in both languages."""
+        for code in ("", " \n\t"):
+            assert analyzer.analyze_python_code(code) == (True, None, [])
+            assert analyzer.analyze_javascript_code(code) == (True, None, [])
+
+    @pytest.mark.parametrize("code, expected_safe, error_substring", JS_CASES)
+    def test_analyze_javascript(self, analyzer, code, expected_safe, error_substring):
+        """Test JavaScript analysis against the case table."""
         safe, error, ops = analyzer.analyze_javascript_code(code)
-        assert safe
-        assert error is None
-        assert ops == []
-
-    def test_analyze_javascript_with_safe_operations(self, analyzer):
-        """Test analysis with safe JavaScript operations."""
-        test_cases = [
-            ("console.log(process.cwd())", True),
-            ("const x = 1 + 2;", True),
-            ("function add(a, b) { return a + b; }", True),
-            ("const arr = [1, 2, 3];", True),
-        ]
-
-        for code, expected_safe in test_cases:
-            safe, error, ops = analyzer.analyze_javascript_code(code)
-            assert safe == expected_safe, f"Failed for code: {code}. Error: {error}"
-
-    def test_analyze_javascript_block_fs_write(self, analyzer):
-        """Test analysis blocking file system write operations."""
-        test_cases = [
-            ("const fs = require('fs'); fs.writeFile('test.txt', 'data')", False),
-            ("require('fs').appendFile('test.txt', 'more')", False),
-            ("fs.unlink('file.txt')", False),
-            ("fs.mkdir('test')", False),
-            ("fs.rename('a', 'b')", False),
-        ]
-
-        for code, expected_safe in test_cases:
-            safe, error, ops = analyzer.analyze_javascript_code(code)
-            assert safe == expected_safe, f"Failed for code: {code}"
-            if not safe:
-                assert "modification operations" in error.lower()
-
-    def test_analyze_javascript_block_eval(self, analyzer):
-        """Test analysis blocking eval and Function constructor."""
-        test_cases = [
-            ("eval('alert(1)')", False),
-            ("new Function('return 1')()", False),
-        ]
-
-        for code, expected_safe in test_cases:
-            safe, error, ops = analyzer.analyze_javascript_code(code)
-            assert safe == expected_safe, f"Failed for code: {code}"
-
-    def test_analyze_javascript_block_child_process(self, analyzer):
-        """Test analysis blocking child_process operations."""
-        test_cases = [
-            ("require('child_process').exec('ls')", False),
-            ("const { spawn } = require('child_process'); spawn('ls')", False),
-        ]
-
-        for code, expected_safe in test_cases:
-            safe, error, ops = analyzer.analyze_javascript_code(code)
-            assert safe == expected_safe, f"Failed for code: {code}"
+        assert safe == expected_safe, f"Failed for code: {code}. Error: {error}"
+        if safe:
+            assert error is None
+            assert ops == []
+        else:
+            assert error_substring in error
+            assert len(ops) > 0
 
     def test_is_code_safe_python(self, analyzer):
         """Test is_code_safe method for Python."""
@@ -196,24 +201,45 @@ class TestCodeAnalyzer:
         """Test is_code_safe method with unsupported language."""
         safe, error = analyzer.is_code_safe("print('hello')", "ruby")
         assert not safe
-        assert "unsupported language" in error.lower()
+        assert "Unsupported language" in error
+
+    def test_module_level_is_code_safe(self):
+        """Test the shared-analyzer is_code_safe function."""
+        assert is_code_safe("import os as o\no.getcwd()") == (True, None)
+        safe, error = is_code_safe("import os as o\no.remove('x')")
+        assert safe is False
+        assert "os.remove" in error
+        # Aliases from the previous call do not leak into the next one
+        assert is_code_safe("o.remove('x')") == (True, None)
+
+    def test_module_level_is_code_safe_caches_verdicts(self):
+        """Test that repeated snippets are answered from the cache."""
+        is_code_safe.cache_clear()
+
+        is_code_safe("print(1)")
+        is_code_safe("print(1)")
+        is_code_safe("print(1)", "javascript")
+
+        info = is_code_safe.cache_info()
+        assert (info.hits, info.misses) == (1, 2)
 
     def test_extract_attribute_chain(self, analyzer):
         """Test _extract_attribute_chain method."""
-        # Test needs actual AST node creation, which is complex
-        # This is covered indirectly through other tests
-        pass
+        node = ast.parse("os.path.join('a')").body[0].value.func
+        assert analyzer._extract_attribute_chain(node) == ['os', 'path', 'join']
+
+        node = ast.parse("f().strip()").body[0].value.func
+        assert analyzer._extract_attribute_chain(node) == ['strip']
 
     def test_check_attribute_call(self, analyzer):
         """Test _check_attribute_call method."""
-        # Test needs module_aliases setup
-        analyzer.module_aliases = {'os': 'os'}
+        module_aliases = {'os': 'os'}
 
         # Test safe function
-        result = analyzer._check_attribute_call(['os', 'getcwd'])
+        result = analyzer._check_attribute_call(['os', 'getcwd'], module_aliases)
         assert result is None
 
         # Test dangerous function
-        result = analyzer._check_attribute_call(['os', 'system'])
+        result = analyzer._check_attribute_call(['os', 'system'], module_aliases)
         assert result is not None
         assert 'os.system' in result
\ No newline at end of file
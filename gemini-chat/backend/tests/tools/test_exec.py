@@ -1,11 +1,18 @@
 """Test exec.py tools for code execution."""
 import pytest
 import asyncio
+import shutil
 
 from gemini_chat_backend.tools.exec import PythonExecTool, JSExecTool
 from gemini_chat_backend.tools.base import ToolResult
 
 
+@pytest.fixture(scope="session")
+def node_available():
+    """Check once per session whether Node.js is on PATH."""
+    return shutil.which("node") is not None
+
+
 class TestPythonExecTool:
     """Test Python execution tool."""
 
@@ -60,7 +67,7 @@ class TestPythonExecTool:
         result = await tool.execute(code="import os; os.system('ls')")
         assert isinstance(result, ToolResult)
         assert not result.success
-        assert "modification operations" in result.error.lower()
+        assert "modification operations" in result.error
 
     @pytest.mark.asyncio
     async def test_block_dangerous_subprocess(self, tool):
@@ -68,7 +75,7 @@ class TestPythonExecTool:
         result = await tool.execute(code="import subprocess; subprocess.run(['ls'])")
         assert isinstance(result, ToolResult)
         assert not result.success
-        assert "modification operations" in result.error.lower()
+        assert "modification operations" in result.error
 
     @pytest.mark.asyncio
     async def test_execute_with_error(self, tool):
@@ -79,18 +86,85 @@ class TestPythonExecTool:
         # The exact behavior depends on implementation
 
     @pytest.mark.asyncio
-    async def test_execute_timeout(self, tool):
+    async def test_traceback_matches_python_c(self, tool):
+        """Test that errors report the snippet's frames only."""
+        result = await tool.execute(code="1/0")
+        assert result.success
+        assert result.result["stderr"] == (
+            "Traceback (most recent call last):\n"
+            '  File "<string>", line 1, in <module>\n'
+            "ZeroDivisionError: division by zero\n"
+        )
+
+    @pytest.mark.asyncio
+    async def test_output_limit_stops_runaway_print(self, tool):
+        """Test that unbounded output is cut off instead of buffered."""
+        result = await tool.execute(code="while True: print('x' * 1000)")
+        assert not result.success
+        assert result.error == "Output limit exceeded (1 MB)"
+
+    @pytest.mark.asyncio
+    async def test_cancellation_kills_process(self, tool, monkeypatch):
+        """Test that cancelling a run kills its interpreter."""
+        from gemini_chat_backend.tools import exec as exec_module
+
+        started = []
+        take_interpreter = exec_module._take_interpreter
+
+        async def recording_take_interpreter(command):
+            proc = await take_interpreter(command)
+            started.append(proc)
+            return proc
+
+        monkeypatch.setattr(exec_module, "_take_interpreter", recording_take_interpreter)
+        task = asyncio.create_task(tool.execute(code="import time; time.sleep(30)"))
+        while not started:
+            await asyncio.sleep(0.01)
+
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert started[0].returncode is not None
+
+    @pytest.mark.asyncio
+    async def test_close_spare_interpreters_reaps_spares(self, tool):
+        """Test that shutdown stops and reaps the pre-started interpreter."""
+        from gemini_chat_backend.tools import exec as exec_module
+
+        await tool.execute(code="print(1)")
+        spares = [proc for proc, _ in exec_module._spare_interpreters.values()]
+        assert spares
+
+        await exec_module.close_spare_interpreters()
+        assert not exec_module._spare_interpreters
+        assert all(proc.returncode is not None for proc in spares)
+
+    @pytest.mark.asyncio
+    async def test_state_does_not_carry_over(self, tool):
+        """Test that each call runs in a fresh interpreter."""
+        await tool.execute(code="import sys; sys.marker = 1")
+        result = await tool.execute(code="import sys; print(hasattr(sys, 'marker'))")
+        assert result.result["stdout"] == "False\n"
+
+    @pytest.mark.asyncio
+    async def test_execute_timeout(self):
         """Test execution timeout handling."""
-        # Create a long-running loop
+        tool = PythonExecTool(timeout=0.5)
+        # Sleep well past the timeout
         result = await tool.execute(code="import time; time.sleep(35)")
         assert isinstance(result, ToolResult)
         assert not result.success
-        assert "timeout" in result.error.lower()
+        assert "timeout" in result.error
 
 
 class TestJSExecTool:
     """Test JavaScript execution tool."""
 
+    @pytest.fixture(autouse=True)
+    def _require_node(self, node_available):
+        if not node_available:
+            pytest.skip("Node.js not installed")
+
     @pytest.fixture
     def tool(self):
         return JSExecTool()
@@ -108,9 +182,6 @@ class TestJSExecTool:
         """Test execution of simple JavaScript code."""
         result = await tool.execute(code="console.log('hello')")
         assert isinstance(result, ToolResult)
-        # Node.js might not be installed, handle both cases
-        if not result.success and "not found" in result.error.lower():
-            pytest.skip("Node.js not installed")
         assert result.success
         assert "hello" in result.result["result"]
 
@@ -119,8 +190,6 @@ class TestJSExecTool:
         """Test execution with single quotes in JavaScript."""
         code = "console.log('test with single quotes')"
         result = await tool.execute(code=code)
-        if not result.success and "not found" in result.error.lower():
-            pytest.skip("Node.js not installed")
         assert result.success
         assert "test with single quotes" in result.result["result"]
 
@@ -129,8 +198,6 @@ class TestJSExecTool:
         """Test execution with backticks (template literals)."""
         code = "console.log(`test with backticks ${1+2}`)"
         result = await tool.execute(code=code)
-        if not result.success and "not found" in result.error.lower():
-            pytest.skip("Node.js not installed")
         assert result.success
         assert "test with backticks" in result.result["result"]
 
@@ -139,8 +206,6 @@ class TestJSExecTool:
         """Test execution with double quotes in JavaScript."""
         code = 'console.log("test with double quotes")'
         result = await tool.execute(code=code)
-        if not result.success and "not found" in result.error.lower():
-            pytest.skip("Node.js not installed")
         assert result.success
         assert "test with double quotes" in result.result["result"]
 
@@ -149,41 +214,49 @@ class TestJSExecTool:
         """Test execution with mixed quotes in JavaScript."""
         code = """console.log('single', "double", `template ${'nested'}`)"""
         result = await tool.execute(code=code)
-        if not result.success and "not found" in result.error.lower():
-            pytest.skip("Node.js not installed")
         assert result.success
         # Should execute without syntax errors
 
+    @pytest.mark.asyncio
+    async def test_execute_code_longer_than_argv_limit(self, tool):
+        """Test that code larger than a single argv entry still runs."""
+        code = "const s = '" + "x" * 200_000 + "';\nconsole.log(s.length)"
+        result = await tool.execute(code=code)
+        assert result.success
+        assert result.result["result"] == "200000\n"
+
+    @pytest.mark.asyncio
+    async def test_state_does_not_carry_over(self, tool):
+        """Test that each call runs in a fresh Node.js process."""
+        await tool.execute(code="globalThis.marker = 1")
+        result = await tool.execute(code="console.log(typeof globalThis.marker)")
+        assert result.result["result"] == "undefined\n"
+
     @pytest.mark.asyncio
     async def test_block_dangerous_fs_write(self, tool):
         """Test blocking dangerous fs.writeFile() in JavaScript."""
         code = "const fs = require('fs'); fs.writeFile('test.txt', 'data')"
         result = await tool.execute(code=code)
-        if not result.success and "not found" in result.error.lower():
-            pytest.skip("Node.js not installed")
         assert not result.success
-        assert "modification operations" in result.error.lower()
+        assert "modification operations" in result.error
 
     @pytest.mark.asyncio
     async def test_execute_with_process_cwd(self, tool):
         """Test execution with process.cwd() in JavaScript."""
         code = "console.log('cwd:', process.cwd())"
         result = await tool.execute(code=code)
-        if not result.success and "not found" in result.error.lower():
-            pytest.skip("Node.js not installed")
         assert result.success
         assert "cwd:" in result.result["result"]
 
     @pytest.mark.asyncio
-    async def test_execute_timeout(self, tool):
+    async def test_execute_timeout(self):
         """Test execution timeout handling."""
+        tool = JSExecTool(timeout=0.5)
         # Create a long-running loop
         code = "while(true) {}"  # Infinite loop
         result = await tool.execute(code=code)
-        if not result.success and "not found" in result.error.lower():
-            pytest.skip("Node.js not installed")
         assert not result.success
-        assert "timeout" in result.error.lower()
+        assert "timeout" in result.error
 
     @pytest.mark.asyncio
     async def test_node_not_found(self, tool):
@@ -0,0 +1,72 @@
+"""Tests for file tools."""
+
+from pathlib import Path
+
+import pytest
+
+from gemini_chat_backend.config import settings
+from gemini_chat_backend.tools.file import FileReadTool, FileWriteTool, _resolve_safe_path
+
+
+@pytest.fixture
+def work_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Point the tool working directory at a temporary directory."""
+    work_dir = tmp_path / "work"
+    work_dir.mkdir()
+    monkeypatch.setattr(settings, "TOOL_WORKING_DIRECTORY", str(work_dir))
+    return work_dir
+
+
+class TestResolveSafePath:
+    """Test suite for _resolve_safe_path."""
+
+    def test_resolves_inside_working_directory(self, work_dir: Path) -> None:
+        """Test that relative paths resolve under the working directory."""
+        assert _resolve_safe_path("a/../b.txt") == work_dir.resolve() / "b.txt"
+
+    def test_rejects_escape_and_sibling_prefix(self, work_dir: Path) -> None:
+        """Test that parents and same-prefix siblings are rejected."""
+        for path in ("../outside.txt", "../work2/file.txt"):
+            with pytest.raises(ValueError, match="Access denied"):
+                _resolve_safe_path(path)
+
+    def test_relative_working_directory_follows_cwd(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a relative working directory is re-resolved after chdir."""
+        monkeypatch.setattr(settings, "TOOL_WORKING_DIRECTORY", ".")
+        for name in ("first", "second"):
+            (tmp_path / name).mkdir()
+            monkeypatch.chdir(tmp_path / name)
+            assert _resolve_safe_path("f.txt") == (tmp_path / name).resolve() / "f.txt"
+
+
+class TestFileTools:
+    """Test suite for the file read and write tools."""
+
+    @pytest.mark.asyncio
+    async def test_write_then_read(self, work_dir: Path) -> None:
+        """Test that a written file, including new parents, reads back."""
+        write = await FileWriteTool().execute(path="sub/note.txt", content="héllo")
+        read = await FileReadTool().execute(path="sub/note.txt")
+
+        assert write.success
+        assert read.result == {"path": "sub/note.txt", "content": "héllo"}
+
+    @pytest.mark.asyncio
+    async def test_read_reports_missing_and_escaping_paths(self, work_dir: Path) -> None:
+        """Test that errors from the worker thread become failed results."""
+        missing = await FileReadTool().execute(path="missing.txt")
+        escaping = await FileReadTool().execute(path="../outside.txt")
+
+        assert missing.error == "File not found: missing.txt"
+        assert "Access denied" in escaping.error
+
+    @pytest.mark.asyncio
+    async def test_read_keeps_line_endings_and_replaces_bad_bytes(self, work_dir: Path) -> None:
+        """Test that content is returned as stored, with invalid UTF-8 replaced."""
+        (work_dir / "mixed.txt").write_bytes(b"a\r\nb\xff\n")
+
+        result = await FileReadTool().execute(path="mixed.txt")
+
+        assert result.result["content"] == "a\r\nb\ufffd\n"
@@ -0,0 +1,64 @@
+"""Tests for the tool registry."""
+
+from typing import Any
+
+import pytest
+
+from gemini_chat_backend.tools.base import BaseTool, ToolResult
+from gemini_chat_backend.tools.registry import ToolRegistry
+
+
+class NoopTool(BaseTool):
+    """Tool that does nothing."""
+
+    def __init__(self, name: str) -> None:
+        super().__init__(name=name, description="Do nothing")
+
+    async def execute(self, **kwargs: Any) -> ToolResult:
+        return ToolResult(success=True)
+
+
+class TestRegisterMany:
+    """Test suite for bulk registration."""
+
+    def test_registers_all_in_order(self) -> None:
+        """Test that tools are added in order with a single version bump."""
+        registry = ToolRegistry()
+
+        registry.register_many([NoopTool("a"), NoopTool("b"), NoopTool("c")])
+
+        assert [t.name for t in registry.list_tools()] == ["a", "b", "c"]
+        assert len(registry) == 3
+        assert registry.version == 1
+
+    def test_duplicate_leaves_registry_unchanged(self) -> None:
+        """Test that a clashing name rejects the whole batch."""
+        registry = ToolRegistry()
+        registry.register(NoopTool("a"))
+
+        with pytest.raises(ValueError, match="'a' is already registered"):
+            registry.register_many([NoopTool("b"), NoopTool("a")])
+        with pytest.raises(ValueError, match="'c' is already registered"):
+            registry.register_many([NoopTool("c"), NoopTool("c")])
+
+        assert [t.name for t in registry.list_tools()] == ["a"]
+        assert registry.version == 1
+
+
+class TestGetDefinitions:
+    """Test suite for cached tool definitions."""
+
+    def test_cached_until_registry_changes(self) -> None:
+        """Test that definitions are reused and rebuilt after each mutation."""
+        registry = ToolRegistry()
+        registry.register(NoopTool("a"))
+        definitions = registry.get_definitions()
+
+        assert registry.get_definitions() is definitions
+
+        registry.register_many([NoopTool("b")])
+        assert [d["function"]["name"] for d in registry.get_definitions()] == ["a", "b"]
+        registry.unregister("a")
+        assert [d["function"]["name"] for d in registry.get_definitions()] == ["b"]
+        registry.clear()
+        assert registry.get_definitions() == []
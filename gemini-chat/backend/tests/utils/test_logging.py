@@ -1,5 +1,6 @@
 """Tests for logging utility module."""
 
+import json
 import logging
 from unittest.mock import patch
 
@@ -13,6 +14,12 @@ from gemini_chat_backend.utils.logging import (
 )
 
 
+@pytest.fixture(scope="class")
+def text_logging():
+    """Configure text logging once for a class of logger tests."""
+    configure_logging(log_level="INFO", log_format="text")
+
+
 class TestConfigureLogging:
     """Test suite for configure_logging function."""
 
@@ -34,6 +41,21 @@ class TestConfigureLogging:
         # This test verifies no exception is raised
         logger.info("Test message", key="value")
 
+    def test_json_format_renders_structlog_and_stdlib_records(self, capsys):
+        """Test that JSON output has the same fields for both kinds of logger."""
+        configure_logging(log_level="INFO", log_format="json")
+
+        get_logger("test_json").info("Hello %s", "world", key="value")
+        logging.getLogger("test_stdlib").warning("Plain %d", 3)
+
+        first, second = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+        assert first["event"] == "Hello world"
+        assert first["key"] == "value"
+        assert (first["logger"], first["level"]) == ("test_json", "info")
+        assert second["event"] == "Plain 3"
+        assert (second["logger"], second["level"]) == ("test_stdlib", "warning")
+        assert "timestamp" in second
+
     def test_text_format_configuration(self):
         """Test text format configuration."""
         configure_logging(log_level="INFO", log_format="text")
@@ -49,13 +71,12 @@ class TestConfigureLogging:
         configure_logging(log_level="INVALID", log_format="text")
 
 
+@pytest.mark.usefixtures("text_logging")
 class TestGetLogger:
     """Test suite for get_logger function."""
 
     def test_get_logger_returns_bound_logger(self):
         """Test that get_logger returns a bound logger."""
-        configure_logging(log_level="INFO", log_format="text")
-
         logger = get_logger("test_module")
 
         assert logger is not None
@@ -64,21 +85,18 @@ class TestGetLogger:
 
     def test_get_logger_with_context(self):
         """Test that get_logger binds context correctly."""
-        configure_logging(log_level="INFO", log_format="text")
-
         logger = get_logger("test_module", request_id="12345")
 
         # Should be able to log with context
         logger.info("Test with context")
 
 
+@pytest.mark.usefixtures("text_logging")
 class TestGetRequestLogger:
     """Test suite for get_request_logger function."""
 
     def test_get_request_logger_binds_request_id(self):
         """Test that request_id is bound to logger."""
-        configure_logging(log_level="INFO", log_format="text")
-
         logger = get_request_logger(request_id="abc-123")
 
         assert logger is not None
@@ -86,8 +104,6 @@ class TestGetRequestLogger:
 
     def test_different_request_ids_create_different_loggers(self):
         """Test that different request IDs create separate logger contexts."""
-        configure_logging(log_level="INFO", log_format="text")
-
         logger1 = get_request_logger(request_id="req-1")
         logger2 = get_request_logger(request_id="req-2")
 
@@ -214,6 +214,14 @@ export default function ChatPage() {
                   currentReactSteps = [...currentReactSteps, reactStep];
                 }
                 break;
+              case 'react_step_delta':
+                // Append streamed text to an existing ReAct step
+                currentReactSteps = currentReactSteps.map(s =>
+                  s.id === event.data.id && s.type === 'thought'
+                    ? { ...s, content: s.content + event.data.delta }
+                    : s
+                );
+                break;
               case 'content':
                 currentContent += event.data;
                 break;
@@ -84,6 +84,7 @@ export type StreamEvent =
   | { type: 'reasoning'; data: string }
   | { type: 'thinking'; data: ThinkingStep }
   | { type: 'react_step'; data: ReActStep }  // New: ReAct step event
+  | { type: 'react_step_delta'; data: { id: string; field: 'content'; delta: string } }  // Incremental update to a streamed step
   | { type: 'tool_call'; data: ToolCall }
   | { type: 'tool_result'; data: { toolCallId: string; result: any } }
   | { type: 'tool_error'; data: { toolCallId: string; error: string } }